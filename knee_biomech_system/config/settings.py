@@ -39,11 +39,13 @@ IMU_CONFIG = {
         "foot_right",
         "foot_left"
     ],
+    "primary_location": "pelvis",  # sensor que define el eje de tiempo IMU
     "orientation_format": "quaternion",  # quaternion, euler
     "output_data": ["quaternion", "acceleration", "angular_velocity"],
     "bluetooth_timeout": 10,  # segundos
     "connection_retry": 3,
     "calibration_duration": 5,  # segundos
+    "max_recording_duration": 60,  # segundos - capacidad por defecto de los buffers
     "signal_quality_threshold": 70  # porcentaje (0-100)
 }
 
@@ -149,6 +151,9 @@ EXERCISES = {
     }
 }
 
+# Mapa inverso nombre visible -> clave de ejercicio
+EXERCISE_NAME_TO_KEY = {v["name"]: k for k, v in EXERCISES.items()}
+
 # ==================== MÉTRICAS Y VALIDACIÓN ====================
 
 METRICS_CONFIG = {
@@ -266,7 +271,8 @@ LOGGING_CONFIG = {
     "file_name": "system.log",
     "file_path": LOGS_DIR / "system.log",
     "max_file_size": 10 * 1024 * 1024,  # 10 MB
-    "backup_count": 5
+    "backup_count": 5,
+    "flush_interval": 30  # s entre volcados del buffer del archivo de log
 }
 
 # ==================== CONFIGURACIÓN DE REPORTES ====================
@@ -5,6 +5,7 @@ Define la paleta de colores, tipografía, estilos de componentes y
 configuraciones visuales para el tema oscuro moderno del sistema.
 """
 
+from functools import lru_cache
 from typing import Dict, Tuple
 
 # ==================== PALETA DE COLORES ====================
@@ -511,6 +512,18 @@ def get_plot_color(index: int) -> str:
     return PLOT_COLORS[index % len(PLOT_COLORS)]
 
 
+@lru_cache(maxsize=32)
+def font(size: int, weight: str = "normal"):
+    """
+    Obtiene una fuente CTkFont compartida para (tamaño, peso).
+
+    Las fuentes de Tk son reutilizables entre widgets, por lo que se crea
+    una sola instancia por combinación. Requiere una ventana raíz existente.
+    """
+    import customtkinter as ctk
+    return ctk.CTkFont(size=size, weight=weight)
+
+
 def apply_matplotlib_style():
     """Aplica el estilo personalizado a matplotlib."""
     import matplotlib.pyplot as plt
@@ -41,6 +41,7 @@ class ForcePlatformHandler:
         self.file_path: Optional[Path] = None
         self.is_calibrated = False
         self.offset_values: Dict[str, float] = {}
+        self._cached_dict: Optional[Dict[str, np.ndarray]] = None
 
         logger.info(f"ForcePlatformHandler inicializado - {self.sampling_rate} Hz")
 
@@ -93,6 +94,7 @@ class ForcePlatformHandler:
 
             self.data = df
             self.file_path = file_path
+            self._cached_dict = None
 
             # Información sobre los datos
             duration = df['time'].max() - df['time'].min()
@@ -144,6 +146,7 @@ class ForcePlatformHandler:
             for channel in channels:
                 self.data[channel] = self.data[channel] - self.offset_values[channel]
 
+            self._cached_dict = None
             self.is_calibrated = True
 
             logger.info(
@@ -220,21 +223,28 @@ class ForcePlatformHandler:
         """
         Obtiene los datos en formato de diccionario.
 
+        El diccionario se cachea hasta la siguiente importación o calibración,
+        por lo que los arrays devueltos son compartidos y deben tratarse como
+        de solo lectura (usar `.copy()` si se necesitan modificar).
+
         Returns:
             Diccionario con todos los canales de datos
         """
         if self.data is None:
             return {}
 
-        return {
-            'time': self.data['time'].values,
-            'fx': self.data['fx'].values,
-            'fy': self.data['fy'].values,
-            'fz': self.data['fz'].values,
-            'mx': self.data['mx'].values,
-            'my': self.data['my'].values,
-            'mz': self.data['mz'].values
-        }
+        if self._cached_dict is None:
+            self._cached_dict = {
+                'time': self.data['time'].values,
+                'fx': self.data['fx'].values,
+                'fy': self.data['fy'].values,
+                'fz': self.data['fz'].values,
+                'mx': self.data['mx'].values,
+                'my': self.data['my'].values,
+                'mz': self.data['mz'].values
+            }
+
+        return self._cached_dict
 
     def detect_contact_events(self, threshold: float = 20.0) -> Tuple[np.ndarray, np.ndarray]:
         """
@@ -8,6 +8,7 @@ IMPLEMENTACIÓN COMPLETA con protocolo real Xsens DOT.
 """
 
 import asyncio
+import sys
 import numpy as np
 from typing import Dict, List, Optional, Tuple, Callable
 from dataclasses import dataclass
@@ -43,6 +44,9 @@ from core.data_acquisition.xsens_dot_protocol import (
 
 logger = get_logger(__name__)
 
+# dataclass(slots=True) solo existe desde Python 3.10 (el proyecto soporta 3.8+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class SensorStatus(Enum):
     """Estado de un sensor."""
@@ -54,7 +58,7 @@ class SensorStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class IMUData:
     """
     Estructura de datos de un sensor IMU.
@@ -73,6 +77,53 @@ class IMUData:
     battery_level: Optional[float] = None
 
 
+class SampleBuffer:
+    """
+    Buffer de muestras preasignado respaldado por un array NumPy.
+
+    Las escrituras son O(1) y sin asignaciones mientras quede capacidad;
+    al llenarse, el array duplica su tamaño (nunca se descartan muestras).
+    """
+
+    def __init__(self, capacity: int, dims: int, dtype=np.float32):
+        """
+        Inicializa el buffer.
+
+        Args:
+            capacity: Número de muestras preasignadas
+            dims: Número de columnas por muestra
+            dtype: Tipo de dato del array
+        """
+        self.data = np.empty((max(capacity, 1), dims), dtype=dtype)
+        self.idx = 0
+
+    def __len__(self) -> int:
+        return self.idx
+
+    def append(self, value):
+        """Escribe una muestra al final, ampliando el array si está lleno."""
+        if self.idx == len(self.data):
+            grown = np.empty((2 * len(self.data), self.data.shape[1]), dtype=self.data.dtype)
+            grown[:self.idx] = self.data
+            self.data = grown
+            logger.debug(f"Buffer IMU ampliado a {len(grown)} muestras")
+        self.data[self.idx] = value
+        self.idx += 1
+
+    def clear(self):
+        """Vacía el buffer sin liberar memoria."""
+        self.idx = 0
+
+    def view(self) -> np.ndarray:
+        """
+        Obtiene las muestras escritas en orden cronológico.
+
+        Returns:
+            Vista (sin copia) de las filas escritas
+        """
+        return self.data[:self.idx]
+
+
 class XsensDOTSensor:
     """
     Clase para manejar un sensor Xsens DOT individual.
@@ -92,7 +143,8 @@ class XsensDOTSensor:
         self.address: Optional[str] = None
         self.client: Optional[BleakClient] = None
 
-        self.data_buffer: List[IMUData] = []
+        # Buffers preasignados, dimensionados en allocate_buffer()
+        self.allocate_buffer(IMU_CONFIG["max_recording_duration"] * IMU_CONFIG["sampling_rate"])
         self.battery_level: float = 100.0
         self.signal_quality: float = 0.0
 
@@ -279,18 +331,29 @@ class XsensDOTSensor:
 
             # Calcular offsets basados en muestras recolectadas
             if len(calibration_samples) >= 10:
+                # Volcar las muestras en arrays preasignados en una sola pasada
+                n = len(calibration_samples)
+                acc_samples = np.empty((n, 3))
+                quat_samples = np.empty((n, 4))
+                n_acc = n_quat = 0
+                for sample in calibration_samples:
+                    if 'acceleration' in sample:
+                        acc_samples[n_acc] = sample['acceleration']
+                        n_acc += 1
+                    if 'quaternion' in sample:
+                        quat_samples[n_quat] = sample['quaternion']
+                        n_quat += 1
+
                 # Promedio de aceleración (debe ser ~[0, 0, 9.81] en N-pose)
-                acc_samples = [s.get('acceleration', np.zeros(3)) for s in calibration_samples if 'acceleration' in s]
-                if acc_samples:
-                    acc_mean = np.mean(acc_samples, axis=0)
+                if n_acc:
+                    acc_mean = acc_samples[:n_acc].mean(axis=0)
                     # Offset de aceleración: diferencia con gravedad esperada
                     self.calibration_offset['acceleration'] = acc_mean - np.array([0, 0, 9.81])
                     logger.debug(f"Offset de aceleración: {self.calibration_offset['acceleration']}")
 
                 # Promedio de cuaternión (orientación de referencia)
-                quat_samples = [s.get('quaternion', np.array([1,0,0,0])) for s in calibration_samples if 'quaternion' in s]
-                if quat_samples:
-                    quat_mean = np.mean(quat_samples, axis=0)
+                if n_quat:
+                    quat_mean = quat_samples[:n_quat].mean(axis=0)
                     # Normalizar
                     quat_mean = quat_mean / np.linalg.norm(quat_mean)
                     self.calibration_offset['quaternion'] = quat_mean
@@ -415,17 +478,47 @@ class XsensDOTSensor:
             logger.error(f"Error deteniendo streaming en {self.location}: {str(e)}", exc_info=True)
             return False
 
+    def allocate_buffer(self, capacity: int):
+        """
+        Preasigna los buffers del sensor.
+
+        Args:
+            capacity: Número de muestras preasignadas (al superarse, los buffers crecen)
+        """
+        self.buffers: Dict[str, SampleBuffer] = {
+            'ts': SampleBuffer(capacity, 1, dtype=np.float64),
+            'acc': SampleBuffer(capacity, 3),
+            'gyro': SampleBuffer(capacity, 3),
+            'quat': SampleBuffer(capacity, 4)
+        }
+
     def add_data_sample(self, data: IMUData):
-        """Añade una muestra de datos al buffer."""
-        self.data_buffer.append(data)
+        """Escribe una muestra en los buffers del sensor."""
+        buffers = self.buffers
+        buffers['ts'].append(data.timestamp)
+        buffers['acc'].append(data.acceleration)
+        buffers['gyro'].append(data.angular_velocity)
+        buffers['quat'].append(data.quaternion)
+
+    def get_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Obtiene las muestras capturadas en orden cronológico.
 
-    def get_data_buffer(self) -> List[IMUData]:
-        """Obtiene el buffer de datos."""
-        return self.data_buffer.copy()
+        Returns:
+            Diccionario con 'timestamp', 'acceleration', 'angular_velocity' y 'quaternion'
+        """
+        buffers = self.buffers
+        return {
+            'timestamp': buffers['ts'].view()[:, 0],
+            'acceleration': buffers['acc'].view(),
+            'angular_velocity': buffers['gyro'].view(),
+            'quaternion': buffers['quat'].view()
+        }
 
     def clear_buffer(self):
         """Limpia el buffer de datos."""
-        self.data_buffer.clear()
+        for buffer in self.buffers.values():
+            buffer.clear()
 
 
 class IMUHandler:
@@ -696,15 +789,37 @@ class IMUHandler:
             logger.error(f"Error deteniendo grabación: {str(e)}", exc_info=True)
             return False
 
-    def get_all_data(self) -> Dict[str, List[IMUData]]:
+    def clear_all_buffers(self, duration: Optional[float] = None):
+        """
+        Reasigna los buffers de todos los sensores para una nueva grabación.
+
+        Se preasigna al menos IMU_CONFIG["max_recording_duration"] para que
+        una grabación algo más larga de lo previsto no obligue a ampliar
+        los buffers; si aun así se supera, crecen sin perder muestras.
+
+        Args:
+            duration: Duración esperada de la grabación en segundos
+                      (None = IMU_CONFIG["max_recording_duration"])
+        """
+        max_duration = IMU_CONFIG["max_recording_duration"]
+        if duration is None or duration < max_duration:
+            duration = max_duration
+
+        capacity = int(duration * self.sampling_rate)
+        for sensor in self.sensors.values():
+            sensor.allocate_buffer(capacity)
+
+        logger.debug(f"Buffers IMU preasignados: {capacity} muestras por sensor")
+
+    def get_all_arrays(self) -> Dict[str, Dict[str, np.ndarray]]:
         """
-        Obtiene los datos de todos los sensores.
+        Obtiene los datos de todos los sensores como arrays.
 
         Returns:
-            Diccionario {location: [IMUData]}
+            Diccionario {location: {'timestamp', 'acceleration', 'angular_velocity', 'quaternion'}}
         """
         return {
-            location: sensor.get_data_buffer()
+            location: sensor.get_arrays()
             for location, sensor in self.sensors.items()
         }
 
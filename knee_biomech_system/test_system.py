@@ -252,6 +252,27 @@ try:
     filename = fm.generate_filename("TEST001", "squat", "demo")
     print(f"   ✓ Nombre generado: {filename}")
 
+    # Ida y vuelta de sesiones: .npz + JSON y, si JSON no basta, pickle
+    import numpy as np
+    for session in (
+        {"time": np.linspace(0, 1, 5), "info": {"reps": 3, "notas": "ok"}},
+        {"time": np.arange(3.0), "imu": {"pelvis": np.ones((3, 4))}, "por_rep": {1: 0.5}},
+    ):
+        path = fm.save_session_data("TEST", "TEST001", "squat", session)
+        loaded = fm.load_session_data(path)
+        loaded.pop("_metadata")
+        same = loaded.keys() == session.keys() and all(
+            np.array_equal(loaded[k], v) if isinstance(v, np.ndarray) else
+            repr(loaded[k]) == repr(v)
+            for k, v in session.items()
+        )
+        for f in path.parent.glob(path.name.split(".")[0] + ".*"):
+            f.unlink()
+        if same:
+            print(f"   ✓ Sesión recuperada sin pérdidas ({path.suffix})")
+        else:
+            print(f"   ✗ La sesión recargada difiere de la guardada ({path.suffix})")
+
 except Exception as e:
     print(f"   ✗ Error en file manager: {e}")
 
@@ -33,6 +33,8 @@ class PlotWidget(ctk.CTkFrame):
         super().__init__(master, **kwargs)
 
         self.title = title
+        self.background = None  # Fondo cacheado para blitting
+        self._live_lines = []  # Líneas animadas actualizadas por blitting
 
         self.configure(
             fg_color=COLORS["bg_secondary"],
@@ -65,6 +67,7 @@ class PlotWidget(ctk.CTkFrame):
 
         # Canvas para el gráfico
         self.canvas = FigureCanvasTkAgg(self.figure, master=self)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
         self.canvas.draw()
         canvas_widget = self.canvas.get_tk_widget()
         canvas_widget.configure(bg=COLORS["bg_secondary"], highlightthickness=0)
@@ -92,6 +95,66 @@ class PlotWidget(ctk.CTkFrame):
 
         self.ax.plot(x, y, label=label, color=color, linewidth=linewidth, **kwargs)
 
+    def setup_live_line(self, n_points, ylim, label=None, color=None, linewidth=2) -> int:
+        """
+        Crea una línea animada para actualizaciones en tiempo real.
+
+        Los ejes quedan fijos (X = índice de muestra, Y = ylim) para que
+        las actualizaciones no requieran redibujar la figura completa.
+
+        Args:
+            n_points: Número de puntos visibles
+            ylim: Límites fijos del eje Y (min, max)
+            label: Etiqueta para leyenda
+            color: Color de la línea
+            linewidth: Grosor de línea
+
+        Returns:
+            Identificador de la línea para update_ydata()
+        """
+        if color is None:
+            line_count = len(self.ax.lines)
+            color = PLOT_COLORS[line_count % len(PLOT_COLORS)]
+
+        line, = self.ax.plot(
+            np.arange(n_points), np.full(n_points, np.nan),
+            label=label, color=color, linewidth=linewidth, animated=True
+        )
+        self.ax.set_xlim(0, n_points - 1)
+        self.ax.set_ylim(*ylim)
+
+        self._live_lines.append(line)
+        return len(self._live_lines) - 1
+
+    def update_ydata(self, line_id: int, y):
+        """
+        Actualiza los datos Y de una línea animada mediante blitting.
+
+        Solo se repinta el área de los ejes sobre el fondo cacheado,
+        sin redibujar la figura completa.
+
+        Args:
+            line_id: Identificador devuelto por setup_live_line()
+            y: Nuevos datos Y (misma longitud que la línea)
+        """
+        self._live_lines[line_id].set_ydata(y)
+
+        if self.background is None:
+            # El primer dibujado completo cachea el fondo (ver _on_draw)
+            self.canvas.draw()
+            return
+
+        self.canvas.restore_region(self.background)
+        for line in self._live_lines:
+            self.ax.draw_artist(line)
+        self.canvas.blit(self.ax.bbox)
+
+    def _on_draw(self, event):
+        """Cachea el fondo de los ejes tras cada dibujado completo."""
+        self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+        for line in self._live_lines:
+            self.ax.draw_artist(line)
+
     def plot_scatter(self, x, y, label=None, color=None, **kwargs):
         """
         Dibuja puntos en el gráfico.
@@ -146,10 +209,21 @@ class PlotWidget(ctk.CTkFrame):
         """
         self.ax.grid(visible, color=COLORS["plot_grid"], alpha=0.3, linestyle='--', **kwargs)
 
+    def widget_width_px(self) -> int:
+        """
+        Obtiene el ancho actual del canvas en píxeles.
+
+        Returns:
+            Ancho del canvas (1 si aún no se ha dibujado)
+        """
+        return self.canvas.get_tk_widget().winfo_width()
+
     def clear(self):
         """Limpia el gráfico."""
         self.ax.clear()
         self.ax.set_facecolor(COLORS["plot_bg"])
+        self._live_lines = []
+        self.background = None
 
     def refresh(self):
         """Actualiza la visualización."""
@@ -7,23 +7,24 @@ Permite capturar datos de sensores y plataforma de fuerza.
 import customtkinter as ctk
 import numpy as np
 import asyncio
+from functools import cached_property
 from typing import Optional, Callable, Dict
-from tkinter import filedialog, messagebox
-from threading import Thread
+from threading import Thread, Lock
 
-from config.ui_theme import COLORS, FONTS
-from config.settings import IMU_CONFIG, EXERCISES
+from config.ui_theme import COLORS, FONTS, font
+from config.settings import IMU_CONFIG, EXERCISES, EXERCISE_NAME_TO_KEY, UI_CONFIG
 from ui.components import SensorPanel, PlotWidget
 from ui.dialogs import show_sensor_assignment_dialog
-from core.data_acquisition.force_platform import ForcePlatformHandler
-from core.data_acquisition.imu_handler import IMUHandler
-from core.data_acquisition.xsens_dot_protocol import OutputMode
-from core.analysis.biomech_analyzer import BiomechAnalyzer
 from models.patient import Patient
 from utils.logger import get_logger
+from utils.lttb import lttb
 
 logger = get_logger(__name__)
 
+# Señal mostrada en vivo durante la grabación: velocidad angular sagital de la tibia
+LIVE_PLOT_LOCATION = "tibia_right"
+LIVE_PLOT_YLIM = (-10.0, 10.0)  # rad/s
+
 
 class CaptureView(ctk.CTkFrame):
     """
@@ -43,17 +44,85 @@ class CaptureView(ctk.CTkFrame):
         super().__init__(master, **kwargs)
 
         self.on_analysis_complete = on_analysis_complete
-        self.force_handler = ForcePlatformHandler()
-        self.imu_handler = IMUHandler()
         self.is_recording = False
         self.captured_data = None  # Datos capturados para análisis
         self.sensors_connected = False
         self.sensors_calibrated = False
+        self._plot_dirty = False  # Gráfico pendiente de redibujar al volver a ser visible
+        self._live_line = None  # Línea animada del gráfico en vivo
+        self._live_dirty = False  # Gráfico en vivo pendiente de actualizar al volver a ser visible
+        self._latest: Dict[str, object] = {}  # Última muestra por sensor (escrita desde el thread BLE)
+        self._drain_job = None
+        self._worker_lock = Lock()  # Una sola operación BLE (conectar/calibrar/grabar) a la vez
+
+        # Event loop persistente para las operaciones BLE (los clientes bleak sobreviven entre llamadas)
+        self._loop = asyncio.new_event_loop()
+        Thread(target=self._loop.run_forever, daemon=True).start()
 
         self.configure(fg_color=COLORS["bg_primary"])
 
         self._create_widgets()
 
+        # Redibujar gráficos pendientes cuando la vista vuelve a mostrarse
+        self.bind("<Map>", self._on_map)
+        self.bind("<Visibility>", self._on_visibility)
+
+    # Los manejadores (y sus dependencias pandas/bleak) se crean en el primer uso
+    @cached_property
+    def force_handler(self):
+        """Manejador de la plataforma de fuerza."""
+        from core.data_acquisition.force_platform import ForcePlatformHandler
+        return ForcePlatformHandler()
+
+    @cached_property
+    def imu_handler(self):
+        """Manejador de los sensores IMU."""
+        from core.data_acquisition.imu_handler import IMUHandler
+        return IMUHandler()
+
+    def destroy(self):
+        """Detiene el event loop de BLE y destruye la vista."""
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        super().destroy()
+
+    def _run_async(self, coro):
+        """
+        Ejecuta una corrutina en el event loop persistente y espera su resultado.
+
+        Debe llamarse desde un thread de trabajo, nunca desde el thread de Tk.
+
+        Args:
+            coro: Corrutina a ejecutar
+
+        Returns:
+            Resultado de la corrutina
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def _start_worker(self, target: Callable, *args) -> bool:
+        """
+        Lanza una operación BLE en un thread si no hay otra en curso.
+
+        Args:
+            target: Función a ejecutar en el thread
+            *args: Argumentos de la función
+
+        Returns:
+            True si se lanzó, False si ya había una operación en curso
+        """
+        if not self._worker_lock.acquire(blocking=False):
+            logger.warning("Operación de sensores en curso; solicitud ignorada")
+            return False
+
+        def _guarded():
+            try:
+                target(*args)
+            finally:
+                self._worker_lock.release()
+
+        Thread(target=_guarded, daemon=True).start()
+        return True
+
     def _create_widgets(self):
         """Crea los widgets de la vista."""
         # Layout de 2 columnas
@@ -75,7 +144,7 @@ class CaptureView(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             right_panel,
             text="Captura de Datos en Tiempo Real",
-            font=ctk.CTkFont(size=FONTS["size_xxlarge"], weight=FONTS["weight_bold"]),
+            font=font(FONTS["size_xxlarge"], FONTS["weight_bold"]),
             text_color=COLORS["text_primary"]
         )
         title_label.grid(row=0, column=0, sticky="w", pady=(0, 20))
@@ -101,7 +170,7 @@ class CaptureView(ctk.CTkFrame):
 
         # Tipo de ejercicio
         ctk.CTkLabel(exercise_frame, text="Tipo de Ejercicio:",
-                    font=ctk.CTkFont(size=FONTS["size_normal"]),
+                    font=font(FONTS["size_normal"]),
                     text_color=COLORS["text_primary"]).pack(anchor="w", pady=(0, 5))
 
         self.exercise_combo = ctk.CTkComboBox(
@@ -114,16 +183,18 @@ class CaptureView(ctk.CTkFrame):
 
         # Duración
         ctk.CTkLabel(exercise_frame, text="Duración (segundos):",
-                    font=ctk.CTkFont(size=FONTS["size_normal"]),
+                    font=font(FONTS["size_normal"]),
                     text_color=COLORS["text_primary"]).pack(anchor="w", pady=(0, 5))
 
-        self.duration_entry = ctk.CTkEntry(exercise_frame, placeholder_text="10")
-        self.duration_entry.insert(0, "10")
+        self.duration_var = ctk.StringVar(value="10")
+        self.duration = 10.0  # Valor validado (None si es inválido)
+        self.duration_entry = ctk.CTkEntry(exercise_frame, textvariable=self.duration_var)
         self.duration_entry.pack(fill="x", pady=(0, 15))
+        self.duration_var.trace_add("write", self._validate_duration)
 
         # Repeticiones
         ctk.CTkLabel(exercise_frame, text="Repeticiones:",
-                    font=ctk.CTkFont(size=FONTS["size_normal"]),
+                    font=font(FONTS["size_normal"]),
                     text_color=COLORS["text_primary"]).pack(anchor="w", pady=(0, 5))
 
         self.reps_entry = ctk.CTkEntry(exercise_frame, placeholder_text="5")
@@ -146,7 +217,7 @@ class CaptureView(ctk.CTkFrame):
         self.platform_status_label = ctk.CTkLabel(
             platform_frame,
             text="Estado: Sin datos",
-            font=ctk.CTkFont(size=FONTS["size_small"]),
+            font=font(FONTS["size_small"]),
             text_color=COLORS["text_secondary"]
         )
         self.platform_status_label.pack(anchor="w")
@@ -194,7 +265,7 @@ class CaptureView(ctk.CTkFrame):
             text="▶ Iniciar Grabación",
             command=self._toggle_recording,
             height=50,
-            font=ctk.CTkFont(size=FONTS["size_large"], weight=FONTS["weight_bold"]),
+            font=font(FONTS["size_large"], FONTS["weight_bold"]),
             fg_color=COLORS["success"],
             hover_color="#5abf6f"
         )
@@ -203,7 +274,7 @@ class CaptureView(ctk.CTkFrame):
         self.timer_label = ctk.CTkLabel(
             record_frame,
             text="00:00",
-            font=ctk.CTkFont(size=FONTS["size_xxlarge"], weight=FONTS["weight_bold"]),
+            font=font(FONTS["size_xxlarge"], FONTS["weight_bold"]),
             text_color=COLORS["text_primary"]
         )
         self.timer_label.pack(pady=10)
@@ -211,7 +282,7 @@ class CaptureView(ctk.CTkFrame):
         self.status_label = ctk.CTkLabel(
             record_frame,
             text="Listo para grabar",
-            font=ctk.CTkFont(size=FONTS["size_normal"]),
+            font=font(FONTS["size_normal"]),
             text_color=COLORS["text_secondary"]
         )
         self.status_label.pack()
@@ -222,13 +293,22 @@ class CaptureView(ctk.CTkFrame):
             text="🔬 Analizar Datos",
             command=self._analyze_data,
             height=45,
-            font=ctk.CTkFont(size=FONTS["size_medium"], weight=FONTS["weight_bold"]),
+            font=font(FONTS["size_medium"], FONTS["weight_bold"]),
             fg_color=COLORS["accent_primary"],
             hover_color=COLORS["accent_hover"],
             state="disabled"
         )
         self.analyze_button.pack(fill="x", pady=(15, 0))
 
+    def _validate_duration(self, *args):
+        """Valida y cachea la duración cada vez que cambia la entrada."""
+        try:
+            value = float(self.duration_var.get())
+        except ValueError:
+            value = None
+        # Positiva y finita (las comparaciones con NaN son falsas)
+        self.duration = value if value is not None and 0 < value < float("inf") else None
+
     def _create_section(self, parent, title: str) -> ctk.CTkFrame:
         """
         Crea una sección con título.
@@ -244,7 +324,7 @@ class CaptureView(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             parent,
             text=title,
-            font=ctk.CTkFont(size=FONTS["size_medium"], weight=FONTS["weight_bold"]),
+            font=font(FONTS["size_medium"], FONTS["weight_bold"]),
             text_color=COLORS["accent_primary"]
         )
         title_label.pack(padx=15, pady=(20, 10), anchor="w")
@@ -257,6 +337,8 @@ class CaptureView(ctk.CTkFrame):
 
     def _import_force_data(self):
         """Importa datos de la plataforma de fuerza."""
+        from tkinter import filedialog
+
         file_path = filedialog.askopenfilename(
             title="Seleccionar archivo de Valkyria",
             filetypes=[("Excel files", "*.xlsx *.xls"), ("All files", "*.*")]
@@ -296,15 +378,26 @@ class CaptureView(ctk.CTkFrame):
         if self.force_handler.data is None:
             return
 
+        # Si el gráfico no está visible, posponer el dibujado hasta <Map>
+        if not self.force_plot.winfo_viewable():
+            self._plot_dirty = True
+            return
+
         data = self.force_handler.get_data_dict()
+        time, fz = data['time'], data['fz']
+
+        # Decimar para visualización (los datos completos se conservan para el análisis)
+        target = max(2000, self.force_plot.widget_width_px() * 2)
+        if len(time) > target:
+            time, fz = lttb(time, fz, target)
 
         # Limpiar gráfico
         self.force_plot.clear()
 
         # Graficar Fz (fuerza vertical)
         self.force_plot.plot_line(
-            data['time'],
-            data['fz'],
+            time,
+            fz,
             label='Fz (vertical)',
             color=COLORS["plot_line_1"],
             linewidth=2
@@ -322,8 +415,25 @@ class CaptureView(ctk.CTkFrame):
 
         logger.debug("Gráfico de fuerzas actualizado")
 
+    def _on_map(self, event=None):
+        """Redibuja el gráfico de fuerzas si quedó pendiente mientras estaba oculto."""
+        if self._plot_dirty:
+            self._plot_dirty = False
+            self._plot_force_data()
+
+    def _on_visibility(self, event=None):
+        """Pone al día los gráficos que no se actualizaron mientras la vista estaba oculta."""
+        self._on_map()
+
+        if self._live_dirty:
+            self._live_dirty = False
+            self._update_live_plot()
+
     def _connect_sensors(self):
         """Conecta los sensores IMU con escaneo y asignación real."""
+        if self._worker_lock.locked():
+            return
+
         logger.info("Iniciando proceso de conexión de sensores...")
 
         # Deshabilitar botón
@@ -340,7 +450,8 @@ class CaptureView(ctk.CTkFrame):
             return
 
         # Conectar sensores en thread separado
-        Thread(target=self._connect_sensors_async, args=(assignments,), daemon=True).start()
+        if not self._start_worker(self._connect_sensors_async, assignments):
+            self.connect_button.configure(state="normal", text="🔍 Escanear y Conectar")
 
     def _connect_sensors_async(self, assignments: Dict[str, str]):
         """
@@ -349,29 +460,25 @@ class CaptureView(ctk.CTkFrame):
         Args:
             assignments: Diccionario {ubicación: dirección_mac}
         """
+        from core.data_acquisition.xsens_dot_protocol import OutputMode
+
         try:
             # Actualizar estado visual
             self.after(0, lambda: self.sensor_panel.update_all_sensors("connecting"))
 
             # Ejecutar conexión asíncrona
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            success = loop.run_until_complete(self.imu_handler.connect_sensors(assignments))
-            loop.close()
+            success = self._run_async(self.imu_handler.connect_sensors(assignments))
 
             if success:
                 logger.info("Todos los sensores conectados exitosamente")
 
                 # Configurar sensores (60 Hz, modo Complete Quaternion)
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                configured = loop.run_until_complete(
+                configured = self._run_async(
                     self.imu_handler.configure_all_sensors(
                         output_rate=60,
                         output_mode=OutputMode.COMPLETE_QUATERNION
                     )
                 )
-                loop.close()
 
                 if configured:
                     logger.info("Sensores configurados correctamente")
@@ -389,6 +496,8 @@ class CaptureView(ctk.CTkFrame):
 
     def _on_sensors_connected_success(self):
         """Callback cuando los sensores se conectan exitosamente."""
+        from tkinter import messagebox
+
         self.sensors_connected = True
 
         # Actualizar estado visual
@@ -410,6 +519,8 @@ class CaptureView(ctk.CTkFrame):
 
     def _on_sensors_connected_error(self, error_msg: str):
         """Callback cuando hay error conectando sensores."""
+        from tkinter import messagebox
+
         self.sensors_connected = False
 
         # Actualizar estado visual
@@ -425,6 +536,8 @@ class CaptureView(ctk.CTkFrame):
 
     def _calibrate_sensors(self):
         """Calibra los sensores en N-pose."""
+        from tkinter import messagebox
+
         if not self.sensors_connected:
             messagebox.showwarning("Sensores no conectados", "Primero debes conectar los sensores.")
             return
@@ -443,33 +556,49 @@ class CaptureView(ctk.CTkFrame):
         if not response:
             return
 
+        # La calibración retiene el lock hasta que termina (ver _on_calibration_done)
+        if not self._worker_lock.acquire(blocking=False):
+            logger.warning("Operación de sensores en curso; calibración ignorada")
+            return
+
         logger.info("Iniciando calibración N-pose...")
 
         # Deshabilitar botones
         self.calibrate_button.configure(state="disabled", text="⏳ Calibrando...")
         self.connect_button.configure(state="disabled")
 
-        # Ejecutar calibración en thread separado
-        Thread(target=self._calibrate_sensors_async, daemon=True).start()
+        # Countdown visual en el thread de Tk; luego se lanza la calibración
+        self._calibration_tick(3)
 
-    def _calibrate_sensors_async(self):
-        """Ejecuta la calibración de forma asíncrona."""
-        try:
-            # Countdown visual (3 segundos)
-            for i in range(3, 0, -1):
-                self.after(0, lambda n=i: self.status_label.configure(text=f"Calibrando en {n}..."))
-                import time
-                time.sleep(1)
+    def _calibration_tick(self, n: int):
+        """
+        Paso del countdown previo a la calibración.
 
-            self.after(0, lambda: self.status_label.configure(text="¡QUIETO! Calibrando..."))
+        Args:
+            n: Segundos restantes
+        """
+        if n > 0:
+            self.status_label.configure(text=f"Calibrando en {n}...")
+            self.after(1000, self._calibration_tick, n - 1)
+            return
 
-            # Ejecutar calibración (5 segundos)
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            success = loop.run_until_complete(self.imu_handler.calibrate_all_sensors(duration=5.0))
-            loop.close()
+        self.status_label.configure(text="¡QUIETO! Calibrando...")
 
-            if success:
+        # Ejecutar calibración (5 segundos) en el event loop persistente
+        future = asyncio.run_coroutine_threadsafe(
+            self.imu_handler.calibrate_all_sensors(duration=5.0), self._loop
+        )
+        future.add_done_callback(self._on_calibration_done)
+
+    def _on_calibration_done(self, future):
+        """
+        Procesa el resultado de la calibración (se ejecuta en el thread del event loop).
+
+        Args:
+            future: Future de la corrutina de calibración
+        """
+        try:
+            if future.result():
                 logger.info("Calibración completada exitosamente")
                 self.after(0, self._on_calibration_success)
             else:
@@ -477,10 +606,15 @@ class CaptureView(ctk.CTkFrame):
 
         except Exception as e:
             logger.error(f"Error en calibración: {e}", exc_info=True)
-            self.after(0, lambda: self._on_calibration_error(str(e)))
+            self.after(0, self._on_calibration_error, str(e))
+
+        finally:
+            self._worker_lock.release()
 
     def _on_calibration_success(self):
         """Callback cuando la calibración es exitosa."""
+        from tkinter import messagebox
+
         self.sensors_calibrated = True
 
         # Actualizar UI
@@ -500,6 +634,8 @@ class CaptureView(ctk.CTkFrame):
 
     def _on_calibration_error(self, error_msg: str):
         """Callback cuando hay error en calibración."""
+        from tkinter import messagebox
+
         self.sensors_calibrated = False
 
         # Rehabilitar botones
@@ -522,6 +658,11 @@ class CaptureView(ctk.CTkFrame):
 
     def _start_recording(self):
         """Inicia la grabación."""
+        from tkinter import messagebox
+
+        if self._worker_lock.locked():
+            return
+
         # Verificar que los sensores estén calibrados
         if not self.sensors_calibrated:
             messagebox.showwarning(
@@ -530,13 +671,26 @@ class CaptureView(ctk.CTkFrame):
             )
             return
 
+        duration = self.duration
+        if duration is None:
+            messagebox.showwarning(
+                "Duración inválida",
+                "La duración debe ser un número de segundos mayor que cero."
+            )
+            return
+
         logger.info("Iniciando grabación de datos IMU...")
 
-        # Limpiar buffers de datos anteriores
-        self.imu_handler.clear_all_buffers()
+        # Limpiar buffers de datos anteriores (la duración solo dimensiona la
+        # preasignación: si la grabación se alarga, los buffers crecen)
+        self.imu_handler.clear_all_buffers(duration)
+        self._setup_live_plot()
+        self._latest = {}
 
         # Iniciar streaming en thread separado
-        Thread(target=self._start_streaming_async, daemon=True).start()
+        if not self._start_worker(self._start_streaming_async):
+            self.status_label.configure(text="Operación de sensores en curso, intenta de nuevo...")
+            return
 
         self.is_recording = True
         self.record_button.configure(
@@ -550,24 +704,76 @@ class CaptureView(ctk.CTkFrame):
         self.connect_button.configure(state="disabled")
         self.calibrate_button.configure(state="disabled")
 
+        # Refresco periódico de la UI (independiente de la tasa de muestras)
+        self._drain_job = self.after(self._drain_interval_ms(), self._drain_latest)
+
         logger.info("Grabación iniciada")
 
+    def _setup_live_plot(self):
+        """Prepara el gráfico de ángulo con ejes fijos para la actualización en vivo."""
+        self.angle_plot.clear()
+        self._live_line = self.angle_plot.setup_live_line(
+            UI_CONFIG["plot_buffer_size"],
+            LIVE_PLOT_YLIM,
+            label=f'Vel. angular ({LIVE_PLOT_LOCATION})',
+            color=COLORS["plot_line_1"]
+        )
+        self.angle_plot.set_labels(xlabel='Muestra', ylabel='Velocidad angular (rad/s)')
+        self.angle_plot.add_grid()
+        self.angle_plot.refresh()
+
+    def _update_live_plot(self):
+        """Actualiza el gráfico en vivo con las últimas muestras del sensor."""
+        if self._live_line is None:
+            return
+
+        window = UI_CONFIG["plot_buffer_size"]
+        gyro = self.imu_handler.sensors[LIVE_PLOT_LOCATION].buffers['gyro'].view()[-window:, 1]
+
+        y = np.full(window, np.nan)
+        if len(gyro):
+            y[-len(gyro):] = gyro
+
+        self.angle_plot.update_ydata(self._live_line, y)
+
+    @staticmethod
+    def _drain_interval_ms() -> int:
+        """Intervalo de refresco de la UI en milisegundos."""
+        return int(1000 / UI_CONFIG["fps_refresh"])
+
+    def _drain_latest(self):
+        """
+        Consume las últimas muestras recibidas y actualiza los gráficos.
+
+        Se ejecuta a la tasa de refresco de la UI, de modo que la cola de
+        eventos de Tk no crece con el número de sensores ni la frecuencia de muestreo.
+        """
+        # Reemplazo atómico de la referencia (sin lock)
+        latest, self._latest = self._latest, {}
+
+        if LIVE_PLOT_LOCATION in latest:
+            # Sin dibujar mientras la vista no es visible (p.ej. otra pestaña activa)
+            if self.winfo_viewable():
+                self._update_live_plot()
+            else:
+                self._live_dirty = True
+
+        if self.is_recording:
+            self._drain_job = self.after(self._drain_interval_ms(), self._drain_latest)
+        else:
+            self._drain_job = None
+
     def _start_streaming_async(self):
         """Inicia el streaming de datos de forma asíncrona."""
         try:
             # Callback para actualizar gráficos en tiempo real
             def data_callback(location: str, imu_data):
                 """Callback para datos en tiempo real."""
-                # Aquí podrías actualizar gráficos en tiempo real si lo deseas
-                pass
+                # Solo se guarda la última muestra; la UI la consume en _drain_latest
+                self._latest[location] = imu_data
 
             # Iniciar streaming
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(
-                self.imu_handler.start_streaming_all(callback=data_callback)
-            )
-            loop.close()
+            self._run_async(self.imu_handler.start_streaming_all(callback=data_callback))
 
             logger.info("Streaming iniciado en todos los sensores")
 
@@ -577,6 +783,8 @@ class CaptureView(ctk.CTkFrame):
 
     def _on_streaming_error(self, error_msg: str):
         """Callback cuando hay error en streaming."""
+        from tkinter import messagebox
+
         self.is_recording = False
 
         self.record_button.configure(
@@ -598,8 +806,14 @@ class CaptureView(ctk.CTkFrame):
         """Detiene la grabación."""
         logger.info("Deteniendo grabación...")
 
-        # Detener streaming en thread separado
-        Thread(target=self._stop_streaming_async, daemon=True).start()
+        # Detener streaming en thread separado (no mientras el inicio siga en curso)
+        if not self._start_worker(self._stop_streaming_async):
+            self.status_label.configure(text="Iniciando streaming, intenta de nuevo...")
+            return
+
+        if self._drain_job is not None:
+            self.after_cancel(self._drain_job)
+            self._drain_job = None
 
         self.is_recording = False
         self.record_button.configure(
@@ -614,10 +828,7 @@ class CaptureView(ctk.CTkFrame):
     def _stop_streaming_async(self):
         """Detiene el streaming de forma asíncrona."""
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(self.imu_handler.stop_streaming_all())
-            loop.close()
+            self._run_async(self.imu_handler.stop_streaming_all())
 
             logger.info("Streaming detenido en todos los sensores")
 
@@ -639,6 +850,8 @@ class CaptureView(ctk.CTkFrame):
 
     def _analyze_data(self):
         """Ejecuta el análisis de los datos capturados."""
+        from core.analysis.biomech_analyzer import BiomechAnalyzer
+
         if self.force_handler.data is None:
             logger.warning("No hay datos de fuerza para analizar")
             return
@@ -689,12 +902,7 @@ class CaptureView(ctk.CTkFrame):
             analyzer = BiomechAnalyzer(patient)
 
             # Obtener tipo de ejercicio seleccionado
-            exercise_name = self.exercise_combo.get()
-            exercise_type = "squat"  # Por defecto
-            for key, value in EXERCISES.items():
-                if value["name"] == exercise_name:
-                    exercise_type = key
-                    break
+            exercise_type = EXERCISE_NAME_TO_KEY.get(self.exercise_combo.get(), "squat")
 
             # Ejecutar análisis completo
             result = analyzer.analyze_full_session(
@@ -730,40 +938,37 @@ class CaptureView(ctk.CTkFrame):
         Returns:
             Tupla (time, imu_data) con los datos capturados
         """
-        # Obtener datos de todos los sensores
-        all_data = self.imu_handler.get_all_data()
+        # Obtener datos de todos los sensores (vistas de los buffers preasignados)
+        all_data = self.imu_handler.get_all_arrays()
 
         if not all_data:
             raise ValueError("No hay datos capturados de los sensores")
 
         # Convertir a formato esperado por el analizador
         imu_data = {}
-        time_arrays = []
+        time_imu = None
+        primary_location = IMU_CONFIG["primary_location"]
 
-        for location, data_list in all_data.items():
-            if not data_list:
+        for location, arrays in all_data.items():
+            n_samples = len(arrays['timestamp'])
+            if n_samples == 0:
                 logger.warning(f"No hay datos para sensor {location}")
                 continue
 
-            # Extraer timestamps
-            timestamps = np.array([d.timestamp for d in data_list])
-            time_arrays.append(timestamps)
-
-            # Extraer datos
-            accelerations = np.array([d.acceleration for d in data_list])
-            angular_velocities = np.array([d.angular_velocity for d in data_list])
-            quaternions = np.array([d.quaternion for d in data_list])
+            # Eje de tiempo del sensor principal (o del primero con datos)
+            if time_imu is None or location == primary_location:
+                time_imu = arrays['timestamp']
 
             imu_data[location] = {
-                'acceleration': accelerations,
-                'angular_velocity': angular_velocities,
-                'quaternion': quaternions
+                'acceleration': arrays['acceleration'],
+                'angular_velocity': arrays['angular_velocity'],
+                'quaternion': arrays['quaternion']
             }
 
-            logger.info(f"Sensor {location}: {len(data_list)} muestras capturadas")
+            logger.info(f"Sensor {location}: {n_samples} muestras capturadas")
 
-        # Usar el array de tiempo más largo (o el primero si todos son iguales)
-        time_imu = time_arrays[0] if time_arrays else np.array([])
+        if time_imu is None:
+            time_imu = np.array([])
 
         logger.info(f"Datos IMU reales obtenidos: {len(time_imu)} muestras, {len(imu_data)} sensores")
 
@@ -786,33 +991,32 @@ class CaptureView(ctk.CTkFrame):
         # Frecuencia de movimiento
         frequency = 0.2  # Hz (ciclo de 5 segundos)
 
-        imu_data = {}
+        locations = ('pelvis', 'femur_right', 'tibia_right')
+        phase_offsets = (0.0, 0.2, 0.5)
 
-        for location in ['pelvis', 'femur_right', 'tibia_right']:
-            # Aceleración simulada
-            acc_x = np.random.randn(n_samples) * 0.5
-            acc_y = np.random.randn(n_samples) * 0.5
-            acc_z = 9.81 + np.random.randn(n_samples) * 0.5
+        # Ruido en un único sorteo: (sensor, muestra, canal) con canales
+        # 0-2 aceleración, 3-5 velocidad angular y 6 ruido de la componente sinusoidal
+        rng = np.random.default_rng()
+        noise = rng.standard_normal((len(locations), n_samples, 7)).astype(np.float32)
 
-            acceleration = np.column_stack([acc_x, acc_y, acc_z])
+        # Cuaternión identidad compartido por todos los sensores (vista sin copia)
+        quaternion = np.broadcast_to(np.array([1, 0, 0, 0], dtype=np.float32), (n_samples, 4))
 
-            # Velocidad angular simulada
-            phase_offset = {'pelvis': 0, 'femur_right': 0.2, 'tibia_right': 0.5}
-            offset = phase_offset.get(location, 0)
-
-            gyro_x = np.random.randn(n_samples) * 0.1
-            gyro_y = 0.5 * np.sin(2 * np.pi * frequency * time + offset) + np.random.randn(n_samples) * 0.05
-            gyro_z = np.random.randn(n_samples) * 0.1
-
-            angular_velocity = np.column_stack([gyro_x, gyro_y, gyro_z])
+        imu_data = {}
 
-            # Quaternions
-            qw = np.ones(n_samples)
-            qx = np.zeros(n_samples)
-            qy = np.zeros(n_samples)
-            qz = np.zeros(n_samples)
+        for i, location in enumerate(locations):
+            # Aceleración simulada (vista del ruido, escalada en sitio)
+            acceleration = noise[i, :, 0:3]
+            acceleration *= 0.5
+            acceleration[:, 2] += 9.81
 
-            quaternion = np.column_stack([qw, qx, qy, qz])
+            # Velocidad angular simulada
+            angular_velocity = noise[i, :, 3:6]
+            angular_velocity *= 0.1
+            angular_velocity[:, 1] = (
+                0.5 * np.sin(2 * np.pi * frequency * time + phase_offsets[i])
+                + noise[i, :, 6] * 0.05
+            )
 
             imu_data[location] = {
                 'acceleration': acceleration,
@@ -4,17 +4,50 @@ Vista de gestión de pacientes.
 Permite crear, editar y visualizar información de pacientes.
 """
 
+import tkinter as tk
 import customtkinter as ctk
 from typing import Optional, Callable
 from datetime import datetime
+from functools import partial
 
-from config.ui_theme import COLORS, FONTS
+from config.ui_theme import COLORS, FONTS, font
 from models.patient import Patient, Sex, AffectedLimb
 from utils.validators import validate_patient_id, validate_patient_data
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Conversión texto del combo <-> enum del modelo
+_SEX_MAP = {"Masculino": Sex.MALE, "Femenino": Sex.FEMALE, "Otro": Sex.OTHER}
+_SEX_MAP_INV = {v: k for k, v in _SEX_MAP.items()}
+
+_LIMB_MAP = {
+    "Derecha": AffectedLimb.RIGHT,
+    "Izquierda": AffectedLimb.LEFT,
+    "Ambas": AffectedLimb.BOTH,
+    "Ninguna": AffectedLimb.NONE
+}
+_LIMB_MAP_INV = {v: k for k, v in _LIMB_MAP.items()}
+
+_SEX_OPTIONS = tuple(_SEX_MAP)
+_LIMB_OPTIONS = tuple(_LIMB_MAP)
+
+# Opciones de pack del contenido del formulario (se re-empaqueta en load_patient)
+_FORM_PACK = {"fill": "both", "expand": True, "padx": 30, "pady": 30}
+
+# Filas del formulario, de arriba abajo (el orden de creación fija el orden de Tab).
+# Cada fila tiene uno o dos campos: (etiqueta, atributo, placeholder u opciones)
+_FORM_ROWS = (
+    (("ID del Paciente *", "patient_id_entry", "Ej: P001"),),
+    (("Nombre Completo *", "name_entry", "Ej: Juan Pérez"),),
+    (("Edad (años) *", "age_entry", "30"),
+     ("Sexo *", "sex_combo", _SEX_OPTIONS)),
+    (("Masa (kg) *", "mass_entry", "70.0"),
+     ("Altura (m) *", "height_entry", "1.75")),
+    (("Extremidad Afectada", "limb_combo", _LIMB_OPTIONS),),
+    (("Diagnóstico", "diagnosis_entry", "Ej: Dolor de rodilla, condromalacia"),),
+)
+
 
 class PatientView(ctk.CTkFrame):
     """
@@ -35,6 +68,8 @@ class PatientView(ctk.CTkFrame):
 
         self.on_patient_saved = on_patient_saved
         self.current_patient: Optional[Patient] = None
+        self._update_job = None  # Recalculo de BMI/peso pendiente (debounce)
+        self._values = {}  # Espejo en Python de la selección de cada combo
 
         self.configure(fg_color=COLORS["bg_primary"])
 
@@ -53,7 +88,7 @@ class PatientView(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             scroll_frame,
             text="Información del Paciente",
-            font=ctk.CTkFont(size=FONTS["size_xxlarge"], weight=FONTS["weight_bold"]),
+            font=font(FONTS["size_xxlarge"], FONTS["weight_bold"]),
             text_color=COLORS["text_primary"]
         )
         title_label.pack(pady=(0, 20), anchor="w")
@@ -64,106 +99,20 @@ class PatientView(ctk.CTkFrame):
 
         # Padding interno
         form_content = ctk.CTkFrame(form_frame, fg_color="transparent")
-        form_content.pack(fill="both", expand=True, padx=30, pady=30)
-
-        # ID del Paciente
-        self._create_field(form_content, "ID del Paciente *", "patient_id", 0,
-                          placeholder="Ej: P001")
-
-        # Nombre
-        self._create_field(form_content, "Nombre Completo *", "name", 1,
-                          placeholder="Ej: Juan Pérez")
-
-        # Frame para edad y sexo (en la misma fila)
-        row2_frame = ctk.CTkFrame(form_content, fg_color="transparent")
-        row2_frame.grid(row=2, column=0, columnspan=2, sticky="ew", pady=10)
-        row2_frame.grid_columnconfigure((0, 1), weight=1)
-
-        # Edad
-        age_frame = ctk.CTkFrame(row2_frame, fg_color="transparent")
-        age_frame.grid(row=0, column=0, sticky="ew", padx=(0, 10))
-
-        age_label = ctk.CTkLabel(age_frame, text="Edad (años) *",
-                                font=ctk.CTkFont(size=FONTS["size_normal"]),
-                                text_color=COLORS["text_primary"])
-        age_label.pack(anchor="w", pady=(0, 5))
-
-        self.age_entry = ctk.CTkEntry(age_frame, placeholder_text="30")
-        self.age_entry.pack(fill="x")
-
-        # Sexo
-        sex_frame = ctk.CTkFrame(row2_frame, fg_color="transparent")
-        sex_frame.grid(row=0, column=1, sticky="ew")
-
-        sex_label = ctk.CTkLabel(sex_frame, text="Sexo *",
-                                font=ctk.CTkFont(size=FONTS["size_normal"]),
-                                text_color=COLORS["text_primary"])
-        sex_label.pack(anchor="w", pady=(0, 5))
-
-        self.sex_combo = ctk.CTkComboBox(
-            sex_frame,
-            values=["Masculino", "Femenino", "Otro"],
-            state="readonly"
-        )
-        self.sex_combo.set("Masculino")
-        self.sex_combo.pack(fill="x")
-
-        # Frame para masa y altura (en la misma fila)
-        row3_frame = ctk.CTkFrame(form_content, fg_color="transparent")
-        row3_frame.grid(row=3, column=0, columnspan=2, sticky="ew", pady=10)
-        row3_frame.grid_columnconfigure((0, 1), weight=1)
-
-        # Masa
-        mass_frame = ctk.CTkFrame(row3_frame, fg_color="transparent")
-        mass_frame.grid(row=0, column=0, sticky="ew", padx=(0, 10))
-
-        mass_label = ctk.CTkLabel(mass_frame, text="Masa (kg) *",
-                                 font=ctk.CTkFont(size=FONTS["size_normal"]),
-                                 text_color=COLORS["text_primary"])
-        mass_label.pack(anchor="w", pady=(0, 5))
+        form_content.pack(**_FORM_PACK)
+        self.form_content = form_content
 
-        self.mass_entry = ctk.CTkEntry(mass_frame, placeholder_text="70.0")
-        self.mass_entry.pack(fill="x")
-
-        # Altura
-        height_frame = ctk.CTkFrame(row3_frame, fg_color="transparent")
-        height_frame.grid(row=0, column=1, sticky="ew")
-
-        height_label = ctk.CTkLabel(height_frame, text="Altura (m) *",
-                                   font=ctk.CTkFont(size=FONTS["size_normal"]),
-                                   text_color=COLORS["text_primary"])
-        height_label.pack(anchor="w", pady=(0, 5))
-
-        self.height_entry = ctk.CTkEntry(height_frame, placeholder_text="1.75")
-        self.height_entry.pack(fill="x")
-
-        # Extremidad afectada
-        limb_label = ctk.CTkLabel(form_content, text="Extremidad Afectada",
-                                 font=ctk.CTkFont(size=FONTS["size_normal"]),
-                                 text_color=COLORS["text_primary"])
-        limb_label.grid(row=4, column=0, sticky="w", pady=(10, 5))
-
-        self.limb_combo = ctk.CTkComboBox(
-            form_content,
-            values=["Derecha", "Izquierda", "Ambas", "Ninguna"],
-            state="readonly"
-        )
-        self.limb_combo.set("Derecha")
-        self.limb_combo.grid(row=4, column=1, sticky="ew", pady=(10, 5))
-
-        # Diagnóstico
-        diag_label = ctk.CTkLabel(form_content, text="Diagnóstico",
-                                 font=ctk.CTkFont(size=FONTS["size_normal"]),
-                                 text_color=COLORS["text_primary"])
-        diag_label.grid(row=5, column=0, sticky="w", pady=(10, 5))
-
-        self.diagnosis_entry = ctk.CTkEntry(form_content,
-                                           placeholder_text="Ej: Dolor de rodilla, condromalacia")
-        self.diagnosis_entry.grid(row=5, column=1, sticky="ew", pady=(10, 5))
+        # Campos en orden de fila; las filas de dos campos van lado a lado (edad/sexo, masa/altura)
+        for row, cells in enumerate(_FORM_ROWS):
+            if len(cells) == 1:
+                label_text, attr, option = cells[0]
+                self._create_field(form_content, label_text, attr, row, option)
+            else:
+                self._create_paired_row(form_content, row, cells)
 
         # Notas
         notes_label = ctk.CTkLabel(form_content, text="Notas Adicionales",
-                                   font=ctk.CTkFont(size=FONTS["size_normal"]),
+                                   font=font(FONTS["size_normal"]),
                                    text_color=COLORS["text_primary"])
         notes_label.grid(row=6, column=0, sticky="nw", pady=(10, 5))
 
@@ -184,7 +133,7 @@ class PatientView(ctk.CTkFrame):
         self.bmi_label = ctk.CTkLabel(
             info_content,
             text="BMI: -- kg/m²",
-            font=ctk.CTkFont(size=FONTS["size_normal"]),
+            font=font(FONTS["size_normal"]),
             text_color=COLORS["text_secondary"]
         )
         self.bmi_label.pack(side="left", padx=(0, 20))
@@ -193,7 +142,7 @@ class PatientView(ctk.CTkFrame):
         self.weight_label = ctk.CTkLabel(
             info_content,
             text="Peso: -- N",
-            font=ctk.CTkFont(size=FONTS["size_normal"]),
+            font=font(FONTS["size_normal"]),
             text_color=COLORS["text_secondary"]
         )
         self.weight_label.pack(side="left")
@@ -207,7 +156,7 @@ class PatientView(ctk.CTkFrame):
             text="Guardar Paciente",
             command=self._save_patient,
             height=40,
-            font=ctk.CTkFont(size=FONTS["size_normal"], weight=FONTS["weight_bold"]),
+            font=font(FONTS["size_normal"], FONTS["weight_bold"]),
             fg_color=COLORS["accent_primary"],
             hover_color="#00bd98"
         )
@@ -218,39 +167,100 @@ class PatientView(ctk.CTkFrame):
             text="Limpiar Formulario",
             command=self._clear_form,
             height=40,
-            font=ctk.CTkFont(size=FONTS["size_normal"]),
+            font=font(FONTS["size_normal"]),
             fg_color=COLORS["bg_tertiary"],
             hover_color=COLORS["bg_hover"]
         )
         clear_button.pack(side="right")
 
         # Vincular eventos para calcular BMI automáticamente
-        self.mass_entry.bind("<KeyRelease>", self._update_calculated_info)
-        self.height_entry.bind("<KeyRelease>", self._update_calculated_info)
+        self.mass_entry.bind("<KeyRelease>", self._schedule_calculated_info)
+        self.height_entry.bind("<KeyRelease>", self._schedule_calculated_info)
 
-    def _create_field(self, parent, label_text, var_name, row, placeholder=""):
+    def _create_field(self, parent, label_text, attr, row, option=""):
         """
-        Crea un campo de formulario.
+        Crea un campo de formulario (etiqueta + entrada) en una fila del grid.
 
         Args:
             parent: Widget padre
             label_text: Texto de la etiqueta
-            var_name: Nombre de la variable
+            attr: Nombre del atributo donde se guarda el widget de entrada
             row: Fila del grid
-            placeholder: Texto placeholder
+            option: Placeholder (str) u opciones de un combo (tuple)
         """
         label = ctk.CTkLabel(parent, text=label_text,
-                           font=ctk.CTkFont(size=FONTS["size_normal"]),
+                           font=font(FONTS["size_normal"]),
                            text_color=COLORS["text_primary"])
         label.grid(row=row, column=0, sticky="w", pady=(10, 5))
 
-        entry = ctk.CTkEntry(parent, placeholder_text=placeholder)
-        entry.grid(row=row, column=1, sticky="ew", pady=(10, 5))
+        widget = self._create_input(parent, attr, option)
+        widget.grid(row=row, column=1, sticky="ew", pady=(10, 5))
 
-        setattr(self, f"{var_name}_entry", entry)
+    def _create_paired_row(self, parent, row, cells):
+        """
+        Crea una fila del grid con varios campos lado a lado.
+
+        Args:
+            parent: Widget padre
+            row: Fila del grid
+            cells: Campos (etiqueta, atributo, placeholder u opciones) de izquierda a derecha
+        """
+        row_frame = ctk.CTkFrame(parent, fg_color="transparent")
+        row_frame.grid(row=row, column=0, columnspan=2, sticky="ew", pady=10)
+        row_frame.grid_columnconfigure((0, 1), weight=1)
+
+        for column, (label_text, attr, option) in enumerate(cells):
+            cell = ctk.CTkFrame(row_frame, fg_color="transparent")
+            cell.grid(row=0, column=column, sticky="ew",
+                      padx=(0, 10) if column == 0 else 0)
+
+            label = ctk.CTkLabel(cell, text=label_text,
+                                 font=font(FONTS["size_normal"]),
+                                 text_color=COLORS["text_primary"])
+            label.pack(anchor="w", pady=(0, 5))
+
+            self._create_input(cell, attr, option).pack(fill="x")
+
+    def _create_input(self, parent, attr, option=""):
+        """
+        Crea el widget de entrada de un campo y lo guarda como atributo.
+
+        Args:
+            parent: Widget padre
+            attr: Nombre del atributo (ej: "age_entry", "sex_combo")
+            option: Placeholder (str) u opciones de un combo (tuple)
+
+        Returns:
+            CTkEntry o CTkComboBox creado
+        """
+        if isinstance(option, tuple):
+            # La variable mantiene self._values al día en cada cambio, así
+            # guardar no necesita consultar el widget
+            var = tk.StringVar(self, value=option[0])
+            var.trace_add("write", partial(self._on_combo_change, attr, var))
+            self._values[attr] = option[0]
+
+            widget = ctk.CTkComboBox(parent, values=list(option), variable=var, state="readonly")
+        else:
+            widget = ctk.CTkEntry(parent, placeholder_text=option)
+
+        setattr(self, attr, widget)
+        return widget
+
+    def _on_combo_change(self, attr, var, *args):
+        """Actualiza el espejo de la selección cuando cambia la variable del combo."""
+        self._values[attr] = var.get()
+
+    def _schedule_calculated_info(self, event=None):
+        """Reprograma el cálculo de BMI/peso para cuando el usuario deje de escribir."""
+        if self._update_job is not None:
+            self.after_cancel(self._update_job)
+        self._update_job = self.after(150, self._update_calculated_info)
 
     def _update_calculated_info(self, event=None):
         """Actualiza información calculada (BMI, peso)."""
+        self._update_job = None
+
         try:
             mass = float(self.mass_entry.get())
             height = float(self.height_entry.get())
@@ -258,14 +268,20 @@ class PatientView(ctk.CTkFrame):
             if mass > 0 and height > 0:
                 # Calcular BMI
                 bmi = mass / (height ** 2)
-                self.bmi_label.configure(text=f"BMI: {bmi:.1f} kg/m²")
+                self._set_label_text(self.bmi_label, f"BMI: {bmi:.1f} kg/m²")
 
                 # Calcular peso en Newtons
                 weight_n = mass * 9.81
-                self.weight_label.configure(text=f"Peso: {weight_n:.1f} N")
+                self._set_label_text(self.weight_label, f"Peso: {weight_n:.1f} N")
         except ValueError:
-            self.bmi_label.configure(text="BMI: -- kg/m²")
-            self.weight_label.configure(text="Peso: -- N")
+            self._set_label_text(self.bmi_label, "BMI: -- kg/m²")
+            self._set_label_text(self.weight_label, "Peso: -- N")
+
+    @staticmethod
+    def _set_label_text(label: ctk.CTkLabel, text: str):
+        """Actualiza el texto de una etiqueta solo si cambió (configure es costoso)."""
+        if label.cget("text") != text:
+            label.configure(text=text)
 
     def _save_patient(self):
         """Guarda la información del paciente."""
@@ -299,17 +315,10 @@ class PatientView(ctk.CTkFrame):
                 return
 
             # Convertir sexo
-            sex_map = {"Masculino": Sex.MALE, "Femenino": Sex.FEMALE, "Otro": Sex.OTHER}
-            sex = sex_map[self.sex_combo.get()]
+            sex = _SEX_MAP[self._values["sex_combo"]]
 
             # Convertir extremidad afectada
-            limb_map = {
-                "Derecha": AffectedLimb.RIGHT,
-                "Izquierda": AffectedLimb.LEFT,
-                "Ambas": AffectedLimb.BOTH,
-                "Ninguna": AffectedLimb.NONE
-            }
-            affected_limb = limb_map[self.limb_combo.get()]
+            affected_limb = _LIMB_MAP[self._values["limb_combo"]]
 
             # Crear paciente
             patient = Patient(
@@ -345,8 +354,8 @@ class PatientView(ctk.CTkFrame):
         self.age_entry.delete(0, "end")
         self.mass_entry.delete(0, "end")
         self.height_entry.delete(0, "end")
-        self.sex_combo.set("Masculino")
-        self.limb_combo.set("Derecha")
+        self.sex_combo.set(_SEX_OPTIONS[0])
+        self.limb_combo.set(_LIMB_OPTIONS[0])
         self.diagnosis_entry.delete(0, "end")
         self.notes_text.delete("1.0", "end")
 
@@ -364,33 +373,33 @@ class PatientView(ctk.CTkFrame):
         Args:
             patient: Paciente a cargar
         """
-        self._clear_form()
-
-        self.patient_id_entry.insert(0, patient.patient_id)
-        self.name_entry.insert(0, patient.name)
-        self.age_entry.insert(0, str(patient.age))
-        self.mass_entry.insert(0, str(patient.mass))
-        self.height_entry.insert(0, str(patient.height))
-
-        # Sexo
-        sex_map_inv = {Sex.MALE: "Masculino", Sex.FEMALE: "Femenino", Sex.OTHER: "Otro"}
-        self.sex_combo.set(sex_map_inv[patient.sex])
-
-        # Extremidad
-        limb_map_inv = {
-            AffectedLimb.RIGHT: "Derecha",
-            AffectedLimb.LEFT: "Izquierda",
-            AffectedLimb.BOTH: "Ambas",
-            AffectedLimb.NONE: "Ninguna"
-        }
-        self.limb_combo.set(limb_map_inv[patient.affected_limb])
-
-        self.diagnosis_entry.insert(0, patient.diagnosis)
-        self.notes_text.insert("1.0", patient.notes)
+        # Ocultar el formulario mientras se rellena: Tk redibuja una sola vez
+        # al volver a mostrarlo en lugar de tras cada insert/set
+        self.form_content.pack_forget()
+        try:
+            self._clear_form()
+
+            self.patient_id_entry.insert(0, patient.patient_id)
+            self.name_entry.insert(0, patient.name)
+            self.age_entry.insert(0, str(patient.age))
+            self.mass_entry.insert(0, str(patient.mass))
+            self.height_entry.insert(0, str(patient.height))
+
+            # Sexo
+            self.sex_combo.set(_SEX_MAP_INV[patient.sex])
+
+            # Extremidad
+            self.limb_combo.set(_LIMB_MAP_INV[patient.affected_limb])
+
+            self.diagnosis_entry.insert(0, patient.diagnosis)
+            self.notes_text.insert("1.0", patient.notes)
+        finally:
+            self.form_content.pack(**_FORM_PACK)
 
         self.current_patient = patient
 
         self._update_calculated_info()
+        self.update_idletasks()
 
         logger.info(f"Paciente cargado: {patient.patient_id}")
 
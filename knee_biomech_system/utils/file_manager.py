@@ -6,16 +6,37 @@ y gestionar archivos de datos del sistema biomecánico.
 """
 
 import os
+import gzip
+import logging
 import json
+import math
 import pickle
+import sqlite3
+import tarfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, Optional, List
-import shutil
+from enum import Enum
+from contextlib import ExitStack
 
 import pandas as pd
 import numpy as np
 
+try:
+    import orjson
+except ImportError:  # orjson es opcional: se usa json de la biblioteca estándar
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # zstandard es opcional: los backups se guardan como .tar sin comprimir
+    zstandard = None
+
 from config.settings import (
     RAW_DATA_DIR, PROCESSED_DATA_DIR, RESULTS_DIR,
     MODELS_DIR, DATABASE_CONFIG
@@ -24,6 +45,97 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Sesiones: arrays numpy en un .npz comprimido y el resto de valores
+# (metadata, escalares, textos) en un JSON adjunto con el mismo nombre.
+SESSION_EXTENSION = "npz"
+SESSION_META_SUFFIX = ".meta.json"
+
+# Listados recientes que se conservan en memoria
+LIST_CACHE_SIZE = 16
+
+# Hilos para borrar archivos en paralelo (unlink libera el GIL)
+CLEANUP_WORKERS = 8
+
+
+# Último timestamp formateado: (segundo epoch, texto). Se reemplaza la tupla
+# completa para que la lectura desde varios hilos sea siempre consistente.
+_timestamp_cache = (0, "")
+
+
+def _file_timestamp() -> str:
+    """
+    Timestamp para nombres de archivo (YYYYmmdd_HHMMSS).
+
+    El texto se formatea una sola vez por segundo; las llamadas
+    dentro del mismo segundo reutilizan la cadena.
+
+    Returns:
+        Timestamp formateado del segundo actual
+    """
+    global _timestamp_cache
+
+    now = int(time.time())
+    cached_second, cached_text = _timestamp_cache
+    if now != cached_second:
+        cached_text = datetime.fromtimestamp(now).strftime("%Y%m%d_%H%M%S")
+        _timestamp_cache = (now, cached_text)
+    return cached_text
+
+
+# Tipos que json serializa tal cual (comparación exacta de tipo, sin subclases numpy)
+_JSON_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+# Claves que np.savez_compressed reserva para sus propios parámetros
+_NPZ_RESERVED_KEYS = frozenset(("file", "allow_pickle"))
+
+
+def _is_json_exact(obj: Any) -> bool:
+    """
+    Indica si un valor vuelve idéntico tras json.dump + json.load.
+
+    Solo str, int, bool, None, floats finitos, listas y dicts con claves
+    str; cualquier otro tipo (tuplas, arrays, subclases numpy, claves int)
+    cambiaría al recargarse.
+
+    Args:
+        obj: Valor a comprobar
+
+    Returns:
+        True si el valor se representa en JSON sin pérdidas
+    """
+    obj_type = type(obj)
+    if obj_type is float:
+        return math.isfinite(obj)
+    if obj_type in _JSON_SCALAR_TYPES:
+        return True
+    if obj_type is list:
+        return all(_is_json_exact(item) for item in obj)
+    if obj_type is dict:
+        return all(type(key) is str and _is_json_exact(value) for key, value in obj.items())
+    return False
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    Convierte a JSON los tipos que el serializador no maneja de forma nativa.
+
+    Args:
+        obj: Objeto no serializable
+
+    Returns:
+        Representación serializable del objeto
+    """
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Objeto de tipo {type(obj).__name__} no serializable en JSON")
+
 
 class FileManager:
     """
@@ -40,6 +152,15 @@ class FileManager:
         self.results_dir = RESULTS_DIR
         self.models_dir = MODELS_DIR
 
+        # Índice SQLite de archivos por directorio (conexión perezosa)
+        self.index_path = Path(RAW_DATA_DIR).parent / "file_index.db"
+        self._index_db: Optional[sqlite3.Connection] = None
+        self._index_lock = threading.Lock()
+        self._synced_mtimes: Dict[str, int] = {}  # directorio -> st_mtime_ns de la última sincronización
+
+        # Caché de listados: (directorio, patrones, mtime del directorio) -> rutas
+        self._list_cache: "OrderedDict[tuple, List[Path]]" = OrderedDict()
+
         # Asegurar que directorios existen
         self._ensure_directories()
 
@@ -48,6 +169,106 @@ class FileManager:
         for directory in [self.raw_dir, self.processed_dir, self.results_dir, self.models_dir]:
             directory.mkdir(parents=True, exist_ok=True)
 
+    def _get_index(self) -> sqlite3.Connection:
+        """
+        Obtiene la conexión al índice de archivos, creándolo si no existe.
+
+        Debe llamarse con self._index_lock adquirido.
+
+        Returns:
+            Conexión SQLite al índice
+        """
+        if self._index_db is None:
+            self._index_db = sqlite3.connect(str(self.index_path), check_same_thread=False)
+            self._index_db.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                "directory TEXT NOT NULL, name TEXT NOT NULL, mtime REAL NOT NULL, "
+                "PRIMARY KEY (directory, name))"
+            )
+        return self._index_db
+
+    def _sync_index(self, directory: Path, mtime_ns: int):
+        """
+        Reconstruye las entradas del índice de un directorio desde disco.
+
+        Se hace cada vez que el mtime del directorio difiere del de la
+        última sincronización, para recoger archivos creados o borrados
+        fuera del gestor (otro proceso, copias, restauraciones). Debe
+        llamarse con self._index_lock adquirido.
+
+        Args:
+            directory: Directorio a sincronizar
+            mtime_ns: st_mtime_ns del directorio, leído antes de recorrerlo
+        """
+        with os.scandir(directory) as it:
+            on_disk = [(entry.name, entry.stat().st_mtime) for entry in it if entry.is_file()]
+
+        key = str(directory)
+        db = self._get_index()
+        with db:
+            db.execute("DELETE FROM files WHERE directory = ?", (key,))
+            db.executemany("INSERT INTO files VALUES (?, ?, ?)",
+                           [(key, name, mtime) for name, mtime in on_disk])
+
+        self._synced_mtimes[key] = mtime_ns
+
+    def _mark_synced(self, files):
+        """
+        Da por sincronizados los directorios de archivos que el propio gestor acaba de cambiar.
+
+        Crear o borrar un archivo cambia el mtime del directorio; si el
+        índice ya estaba al día, se registra el mtime nuevo para que ese
+        cambio propio no provoque una resincronización completa. Debe
+        llamarse con self._index_lock adquirido, tras actualizar el índice.
+
+        Args:
+            files: Archivos guardados o borrados
+        """
+        for key in {str(f.parent) for f in files}:
+            if key in self._synced_mtimes:
+                self._synced_mtimes[key] = os.stat(key).st_mtime_ns
+
+    def _index_add(self, *files: Path):
+        """
+        Registra archivos recién guardados en el índice.
+
+        Si el índice falla, el directorio se marca para resincronizar en
+        el próximo listado; el archivo ya está guardado en disco.
+
+        Args:
+            *files: Archivos a registrar
+        """
+        with self._index_lock:
+            try:
+                db = self._get_index()
+                with db:
+                    db.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?)",
+                                   [(str(f.parent), f.name, f.stat().st_mtime) for f in files])
+                self._mark_synced(files)
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"No se pudo actualizar el índice de archivos: {e}")
+                for f in files:
+                    self._synced_mtimes.pop(str(f.parent), None)
+
+    def _index_remove(self, files: List[Path]):
+        """
+        Elimina archivos borrados del índice.
+
+        Args:
+            files: Archivos a eliminar del índice
+        """
+        with self._index_lock:
+            try:
+                db = self._get_index()
+                with db:
+                    db.executemany("DELETE FROM files WHERE directory = ? AND name = ?",
+                                   [(str(f.parent), f.name) for f in files])
+                self._mark_synced(files)
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"No se pudo actualizar el índice de archivos: {e}")
+                for f in files:
+                    self._synced_mtimes.pop(str(f.parent), None)
+
     def generate_filename(self, patient_id: str, exercise: str,
                          category: str = "session", extension: str = "pkl") -> str:
         """
@@ -62,14 +283,21 @@ class FileManager:
         Returns:
             Nombre de archivo con formato: PatientID_Exercise_Category_Timestamp.ext
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = _file_timestamp()
         filename = f"{patient_id}_{exercise}_{category}_{timestamp}.{extension}"
         return filename
 
     def save_session_data(self, session_id: str, patient_id: str,
                          exercise: str, data: Dict[str, Any]) -> Optional[Path]:
         """
-        Guarda datos de una sesión en formato pickle.
+        Guarda datos de una sesión.
+
+        Los arrays numpy del primer nivel de `data` se guardan en binario
+        en un archivo .npz comprimido; el resto de valores (incluida la
+        metadata) va a un JSON adjunto (<nombre>.meta.json). Si algún valor
+        no puede representarse en JSON sin pérdidas (arrays anidados,
+        claves no str, tuplas, objetos...), la sesión completa se guarda
+        en pickle (.pkl.gz), de modo que la carga devuelve siempre lo guardado.
 
         Args:
             session_id: ID de la sesión
@@ -78,34 +306,91 @@ class FileManager:
             data: Diccionario con datos a guardar
 
         Returns:
-            Path del archivo guardado o None si falla
+            Path del archivo guardado (.npz o .pkl.gz) o None si falla
         """
         try:
-            filename = self.generate_filename(patient_id, exercise, "session", "pkl")
-            filepath = self.processed_dir / filename
-
-            # Añadir metadata
-            data['_metadata'] = {
+            metadata = {
                 'session_id': session_id,
                 'patient_id': patient_id,
                 'exercise': exercise,
                 'saved_at': datetime.now().isoformat(),
-                'version': '1.0'
+                'version': '2.0'
             }
 
-            with open(filepath, 'wb') as f:
-                pickle.dump(data, f)
-
-            logger.info(f"Sesión guardada: {filepath}")
+            # Separar arrays (binario) del resto de valores (JSON)
+            arrays = {}
+            fields = {}
+            for key, value in data.items():
+                if (type(value) is np.ndarray and value.dtype != object
+                        and type(key) is str and key not in _NPZ_RESERVED_KEYS):
+                    arrays[key] = value
+                else:
+                    fields[key] = value
+            fields['_metadata'] = metadata
+
+            if _is_json_exact(fields):
+                filename = self.generate_filename(patient_id, exercise, "session", SESSION_EXTENSION)
+                filepath = self.processed_dir / filename
+                meta_path = filepath.with_suffix(SESSION_META_SUFFIX)
+                self._write_npz_session(filepath, meta_path, arrays, fields)
+                self._index_add(meta_path, filepath)
+            else:
+                # Valores que JSON no representa sin pérdidas: formato pickle
+                filename = self.generate_filename(patient_id, exercise, "session", "pkl.gz")
+                filepath = self.processed_dir / filename
+                payload = dict(data)
+                payload['_metadata'] = metadata
+                with gzip.open(filepath, 'wb', compresslevel=1) as f:
+                    pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+                self._index_add(filepath)
+
+            logger.info("Sesión guardada: %s", filepath)
             return filepath
 
         except Exception as e:
             logger.error(f"Error guardando sesión: {str(e)}", exc_info=True)
             return None
 
+    @staticmethod
+    def _write_npz_session(filepath: Path, meta_path: Path,
+                           arrays: Dict[str, np.ndarray], fields: Dict[str, Any]):
+        """
+        Escribe el .npz y su .meta.json mediante archivos temporales.
+
+        Ambos se escriben completos antes de renombrarlos (primero el .npz),
+        así que un fallo no deja un .meta.json huérfano ni archivos a medias.
+
+        Args:
+            filepath: Ruta final del .npz
+            meta_path: Ruta final del JSON adjunto
+            arrays: Arrays a guardar en el .npz
+            fields: Resto de valores (JSON exacto)
+        """
+        tmp_npz = filepath.with_name(filepath.name + ".tmp")
+        tmp_meta = meta_path.with_name(meta_path.name + ".tmp")
+        try:
+            with open(tmp_npz, 'wb') as f:
+                np.savez_compressed(f, **arrays)
+            with open(tmp_meta, 'w', encoding='utf-8') as f:
+                json.dump(fields, f, ensure_ascii=False, allow_nan=False)
+
+            os.replace(tmp_npz, filepath)
+            try:
+                os.replace(tmp_meta, meta_path)
+            except OSError:
+                filepath.unlink()
+                raise
+        finally:
+            for tmp in (tmp_npz, tmp_meta):
+                if tmp.exists():
+                    tmp.unlink()
+
     def load_session_data(self, filepath: Path) -> Optional[Dict[str, Any]]:
         """
-        Carga datos de una sesión desde archivo pickle.
+        Carga datos de una sesión.
+
+        Acepta sesiones .npz (con su .meta.json) y los formatos
+        pickle anteriores (.pkl.gz y .pkl).
 
         Args:
             filepath: Ruta al archivo
@@ -118,8 +403,16 @@ class FileManager:
                 logger.error(f"Archivo no encontrado: {filepath}")
                 return None
 
-            with open(filepath, 'rb') as f:
-                data = pickle.load(f)
+            if filepath.suffix == '.npz':
+                with open(filepath.with_suffix(SESSION_META_SUFFIX), 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+
+                with np.load(filepath) as npz:
+                    data.update((key, npz[key]) for key in npz.files)
+            else:
+                opener = gzip.open if filepath.suffix == '.gz' else open
+                with opener(filepath, 'rb') as f:
+                    data = pickle.load(f)
 
             logger.info(f"Sesión cargada: {filepath}")
             return data
@@ -129,15 +422,20 @@ class FileManager:
             return None
 
     def save_results(self, session_id: str, patient_id: str,
-                    exercise: str, results: Dict[str, Any]) -> Optional[Path]:
+                    exercise: str, results: Dict[str, Any],
+                    pretty: bool = False) -> Optional[Path]:
         """
         Guarda resultados de análisis en formato JSON.
 
+        Los floats no finitos (NaN, ±inf) se guardan como null, con o sin
+        orjson, para que el archivo sea JSON estándar e idéntico en ambos casos.
+
         Args:
             session_id: ID de la sesión
             patient_id: ID del paciente
             exercise: Tipo de ejercicio
             results: Diccionario con resultados
+            pretty: Indentar el JSON para lectura humana (por defecto compacto)
 
         Returns:
             Path del archivo guardado o None si falla
@@ -146,21 +444,34 @@ class FileManager:
             filename = self.generate_filename(patient_id, exercise, "results", "json")
             filepath = self.results_dir / filename
 
-            # Convertir numpy arrays a listas para JSON
-            results_serializable = self._make_json_serializable(results)
-
-            # Añadir metadata
-            results_serializable['_metadata'] = {
+            # Añadir metadata (copia superficial: no se modifica el dict del llamador)
+            payload = dict(results)
+            payload['_metadata'] = {
                 'session_id': session_id,
                 'patient_id': patient_id,
                 'exercise': exercise,
                 'analyzed_at': datetime.now().isoformat()
             }
 
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(results_serializable, f, indent=2, ensure_ascii=False)
-
-            logger.info(f"Resultados guardados: {filepath}")
+            if orjson is not None:
+                # orjson serializa arrays numpy en C, sin recorrer el dict en Python
+                option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                if pretty:
+                    option |= orjson.OPT_INDENT_2
+                filepath.write_bytes(orjson.dumps(payload, option=option, default=_json_default))
+            else:
+                # Convertir numpy arrays a listas para JSON
+                results_serializable = self._make_json_serializable(payload)
+
+                # Compacto salvo que se pida: la indentación casi duplica el tamaño
+                format_kwargs = {'indent': 2} if pretty else {'separators': (',', ':')}
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    json.dump(results_serializable, f, ensure_ascii=False, allow_nan=False,
+                              default=_json_default, **format_kwargs)
+
+            self._index_add(filepath)
+
+            logger.info("Resultados guardados: %s", filepath)
             return filepath
 
         except Exception as e:
@@ -171,22 +482,49 @@ class FileManager:
         """
         Convierte objetos a formato serializable en JSON.
 
+        Copia solo los dicts/listas que contienen algo que convertir; los
+        subárboles ya serializables se devuelven por referencia. Los
+        floats no finitos (NaN, ±inf) se escriben como null, igual que orjson.
+
         Args:
             obj: Objeto a convertir
 
         Returns:
             Objeto serializable
         """
-        if isinstance(obj, np.ndarray):
+        if type(obj) is float:
+            return obj if math.isfinite(obj) else None
+        elif type(obj) in _JSON_SCALAR_TYPES:
+            return obj
+        elif isinstance(obj, np.ndarray):
+            if obj.dtype.kind == 'f' and not np.isfinite(obj).all():
+                # Los no finitos pasan a None en una copia object
+                cleaned = obj.astype(object)
+                cleaned[~np.isfinite(obj)] = None
+                return cleaned.tolist()
             return obj.tolist()
         elif isinstance(obj, np.integer):
             return int(obj)
         elif isinstance(obj, np.floating):
-            return float(obj)
+            return self._make_json_serializable(float(obj))
         elif isinstance(obj, dict):
-            return {key: self._make_json_serializable(value) for key, value in obj.items()}
+            converted = None
+            for key, value in obj.items():
+                new_value = self._make_json_serializable(value)
+                if new_value is not value:
+                    if converted is None:
+                        converted = dict(obj)
+                    converted[key] = new_value
+            return obj if converted is None else converted
         elif isinstance(obj, list):
-            return [self._make_json_serializable(item) for item in obj]
+            converted = None
+            for i, item in enumerate(obj):
+                new_item = self._make_json_serializable(item)
+                if new_item is not item:
+                    if converted is None:
+                        converted = list(obj)
+                    converted[i] = new_item
+            return obj if converted is None else converted
         else:
             return obj
 
@@ -195,6 +533,8 @@ class FileManager:
         """
         Exporta datos a formato CSV.
 
+        Usa el escritor de pyarrow si está instalado; si no, pandas.
+
         Args:
             data: DataFrame con datos
             patient_id: ID del paciente
@@ -208,7 +548,25 @@ class FileManager:
             filename = self.generate_filename(patient_id, exercise, data_type, "csv")
             filepath = self.results_dir / filename
 
-            data.to_csv(filepath, index=False, encoding='utf-8')
+            try:
+                import pyarrow as pa
+                import pyarrow.csv as pa_csv
+            except ImportError:
+                pa = None
+
+            written = False
+            if pa is not None:
+                # Escritor CSV de Arrow: formateo vectorizado en C++ y multihilo
+                try:
+                    table = pa.Table.from_pandas(data, preserve_index=False)
+                    pa_csv.write_csv(table, filepath)
+                    written = True
+                except pa.lib.ArrowException as e:
+                    # p. ej. columnas object con tipos mezclados: pandas sí las escribe
+                    logger.debug("pyarrow no pudo escribir el CSV (%s); se usa pandas", e)
+
+            if not written:
+                data.to_csv(filepath, index=False, encoding='utf-8')
 
             logger.info(f"Datos exportados a CSV: {filepath}")
             return filepath
@@ -245,6 +603,85 @@ class FileManager:
             logger.error(f"Error exportando Excel: {str(e)}", exc_info=True)
             return None
 
+    def _list_files(self, directory: Path, *patterns: str) -> List[Path]:
+        """
+        Lista archivos de un directorio que cumplen algún patrón, del más reciente al más antiguo.
+
+        Consulta el índice SQLite (una sola SELECT ordenada) en lugar de
+        recorrer el directorio; si el directorio ha cambiado desde la última
+        sincronización, el índice se reconstruye antes desde el disco. Los
+        listados repetidos sin cambios en el directorio se sirven desde memoria.
+
+        Args:
+            directory: Directorio a listar
+            *patterns: Patrones estilo glob sobre el nombre del archivo
+
+        Returns:
+            Lista de rutas ordenada por fecha de modificación descendente
+        """
+        key = str(directory)
+        where = " OR ".join(["name GLOB ?"] * len(patterns))
+
+        # El mtime del directorio cambia al crear o borrar archivos, así que
+        # invalida por sí solo los listados guardados
+        mtime_ns = directory.stat().st_mtime_ns
+        cache_key = (key, patterns, mtime_ns)
+
+        with self._index_lock:
+            cached = self._list_cache.get(cache_key)
+            if cached is not None:
+                self._list_cache.move_to_end(cache_key)
+                return list(cached)
+
+            if self._synced_mtimes.get(key) != mtime_ns:
+                self._sync_index(directory, mtime_ns)
+
+            rows = self._get_index().execute(
+                f"SELECT name FROM files WHERE directory = ? AND ({where}) ORDER BY mtime DESC",
+                (key, *patterns)
+            ).fetchall()
+
+            files = [directory / name for (name,) in rows]
+            self._list_cache[cache_key] = files
+            if len(self._list_cache) > LIST_CACHE_SIZE:
+                self._list_cache.popitem(last=False)
+
+        return list(files)
+
+    def export_to_parquet(self, data_dict: Dict[str, pd.DataFrame],
+                          patient_id: str, exercise: str) -> Optional[Path]:
+        """
+        Exporta múltiples DataFrames a Parquet (un archivo por tabla).
+
+        Alternativa a export_to_excel para análisis posterior: escritura
+        columnar en C y archivos mucho más pequeños. Requiere pyarrow.
+
+        Args:
+            data_dict: Diccionario {nombre_tabla: DataFrame}
+            patient_id: ID del paciente
+            exercise: Tipo de ejercicio
+
+        Returns:
+            Path del directorio exportado o None si falla
+        """
+        try:
+            import pyarrow  # noqa: F401 - falla antes de crear el directorio si no está
+
+            dirname = self.generate_filename(patient_id, exercise, "full_report", "parquet")
+            dirpath = self.results_dir / dirname
+            dirpath.mkdir(parents=True, exist_ok=True)
+
+            for table_name, df in data_dict.items():
+                df.to_parquet(dirpath / f"{table_name}.parquet",
+                              engine='pyarrow', compression='zstd', index=False)
+
+            logger.info(f"Datos exportados a Parquet: {dirpath}")
+            return dirpath
+
+        except Exception as e:
+            logger.error(f"Error exportando Parquet: {str(e)}", exc_info=True)
+            return None
+
     def list_sessions(self, patient_id: Optional[str] = None) -> List[Path]:
         """
         Lista archivos de sesiones disponibles.
@@ -256,11 +693,13 @@ class FileManager:
             Lista de rutas a archivos de sesión
         """
         try:
-            pattern = f"{patient_id}_*_session_*.pkl" if patient_id else "*_session_*.pkl"
-            sessions = list(self.processed_dir.glob(pattern))
+            # .npz es el formato actual; .pkl* cubre los formatos pickle anteriores
+            prefix = f"{patient_id}_*_session_*" if patient_id else "*_session_*"
+            sessions = self._list_files(self.processed_dir, f"{prefix}.{SESSION_EXTENSION}",
+                                        f"{prefix}.pkl*")
 
-            logger.debug(f"Encontradas {len(sessions)} sesiones")
-            return sorted(sessions, key=lambda x: x.stat().st_mtime, reverse=True)
+            logger.debug("Encontradas %d sesiones", len(sessions))
+            return sessions
 
         except Exception as e:
             logger.error(f"Error listando sesiones: {str(e)}", exc_info=True)
@@ -278,10 +717,10 @@ class FileManager:
         """
         try:
             pattern = f"{patient_id}_*_results_*.json" if patient_id else "*_results_*.json"
-            results = list(self.results_dir.glob(pattern))
+            results = self._list_files(self.results_dir, pattern)
 
-            logger.debug(f"Encontrados {len(results)} resultados")
-            return sorted(results, key=lambda x: x.stat().st_mtime, reverse=True)
+            logger.debug("Encontrados %d resultados", len(results))
+            return results
 
         except Exception as e:
             logger.error(f"Error listando resultados: {str(e)}", exc_info=True)
@@ -291,6 +730,10 @@ class FileManager:
         """
         Crea backup de todos los datos.
 
+        Todo se escribe en un único archivo tar en streaming
+        (backup_<timestamp>.tar.zst si zstandard está instalado,
+        .tar si no), en lugar de recrear cada archivo en el destino.
+
         Args:
             backup_dir: Directorio de backup (por defecto: data/backups/)
 
@@ -303,17 +746,25 @@ class FileManager:
 
             backup_dir.mkdir(parents=True, exist_ok=True)
 
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_path = backup_dir / f"backup_{timestamp}"
+            timestamp = _file_timestamp()
+            extension = "tar.zst" if zstandard is not None else "tar"
+            backup_path = backup_dir / f"backup_{timestamp}.{extension}"
 
-            # Copiar directorios
-            shutil.copytree(self.processed_dir, backup_path / "processed")
-            shutil.copytree(self.results_dir, backup_path / "results")
+            with ExitStack() as stack:
+                stream = stack.enter_context(open(backup_path, 'wb'))
+                if zstandard is not None:
+                    compressor = zstandard.ZstdCompressor(level=3)
+                    stream = stack.enter_context(compressor.stream_writer(stream))
+                tar = stack.enter_context(tarfile.open(fileobj=stream, mode='w|'))
 
-            # Copiar base de datos si existe
-            db_path = DATABASE_CONFIG["path"]
-            if db_path.exists():
-                shutil.copy2(db_path, backup_path / db_path.name)
+                # Directorios de datos
+                tar.add(self.processed_dir, arcname="processed")
+                tar.add(self.results_dir, arcname="results")
+
+                # Base de datos si existe
+                db_path = DATABASE_CONFIG["path"]
+                if db_path.exists():
+                    tar.add(db_path, arcname=db_path.name)
 
             logger.info(f"Backup creado: {backup_path}")
             return True
@@ -334,14 +785,22 @@ class FileManager:
         """
         try:
             cutoff_time = datetime.now().timestamp() - (days * 24 * 3600)
-            deleted_count = 0
 
+            # Reunir candidatos en una pasada por directorio
+            old_files = []
             for directory in [self.processed_dir, self.results_dir]:
-                for file in directory.glob("*"):
-                    if file.is_file() and file.stat().st_mtime < cutoff_time:
-                        file.unlink()
-                        deleted_count += 1
-                        logger.debug(f"Eliminado: {file}")
+                with os.scandir(directory) as it:
+                    old_files.extend(Path(entry.path) for entry in it
+                                     if entry.is_file() and entry.stat().st_mtime < cutoff_time)
+
+            # Borrar en paralelo: son llamadas de E/S que no compiten por el GIL
+            deleted_count = 0
+            if old_files:
+                with ThreadPoolExecutor(max_workers=CLEANUP_WORKERS) as executor:
+                    deleted_count = sum(executor.map(self._delete_file, old_files))
+
+                # Los que ya no existían tampoco deben seguir en el índice
+                self._index_remove(old_files)
 
             logger.info(f"Limpieza completada: {deleted_count} archivos eliminados")
             return deleted_count
@@ -350,6 +809,27 @@ class FileManager:
             logger.error(f"Error limpiando archivos: {str(e)}", exc_info=True)
             return 0
 
+    @staticmethod
+    def _delete_file(file: Path) -> bool:
+        """
+        Elimina un archivo (usado por clean_old_files desde el pool de hilos).
+
+        Args:
+            file: Archivo a eliminar
+
+        Returns:
+            True si se eliminó, False si ya no existía
+        """
+        try:
+            file.unlink()
+        except FileNotFoundError:
+            return False
+
+        # Por archivo: no formatear nada si DEBUG está desactivado
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Eliminado: %s", file)
+        return True
+
     def get_file_info(self, filepath: Path) -> Dict[str, Any]:
         """
         Obtiene información sobre un archivo.
@@ -380,26 +860,46 @@ class FileManager:
             return {}
 
 
-# Instancia global del gestor
-file_manager = FileManager()
+# Instancia global del gestor (se crea en el primer uso, no al importar)
+@lru_cache(maxsize=None)
+def get_file_manager() -> FileManager:
+    """
+    Obtiene la instancia global del gestor de archivos.
+
+    Returns:
+        FileManager compartido
+    """
+    return FileManager()
+
+
+def __getattr__(name: str):
+    """Mantiene `from utils.file_manager import file_manager` creando la instancia al pedirla."""
+    if name == "file_manager":
+        return get_file_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Funciones de conveniencia
 def save_session(session_id: str, patient_id: str, exercise: str, data: Dict) -> Optional[Path]:
     """Guarda datos de sesión (función de conveniencia)."""
-    return file_manager.save_session_data(session_id, patient_id, exercise, data)
+    return get_file_manager().save_session_data(session_id, patient_id, exercise, data)
 
 
 def load_session(filepath: Path) -> Optional[Dict]:
     """Carga datos de sesión (función de conveniencia)."""
-    return file_manager.load_session_data(filepath)
+    return get_file_manager().load_session_data(filepath)
 
 
 def export_csv(data: pd.DataFrame, patient_id: str, exercise: str) -> Optional[Path]:
     """Exporta a CSV (función de conveniencia)."""
-    return file_manager.export_to_csv(data, patient_id, exercise)
+    return get_file_manager().export_to_csv(data, patient_id, exercise)
 
 
 def export_excel(data_dict: Dict[str, pd.DataFrame], patient_id: str, exercise: str) -> Optional[Path]:
     """Exporta a Excel (función de conveniencia)."""
-    return file_manager.export_to_excel(data_dict, patient_id, exercise)
+    return get_file_manager().export_to_excel(data_dict, patient_id, exercise)
+
+
+def export_parquet(data_dict: Dict[str, pd.DataFrame], patient_id: str, exercise: str) -> Optional[Path]:
+    """Exporta a Parquet (función de conveniencia)."""
+    return get_file_manager().export_to_parquet(data_dict, patient_id, exercise)
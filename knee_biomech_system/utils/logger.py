@@ -5,16 +5,305 @@ Proporciona funcionalidades de registro de eventos, errores y debug
 con rotación de archivos y niveles configurables.
 """
 
+import atexit
+import io
+import locale
 import logging
+import os
+import queue
 import sys
+import threading
+import time
+from collections import deque
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 
 from config.settings import LOGGING_CONFIG
 
 
+class _PooledFormatter(logging.Formatter):
+    """
+    Formatter que compone la salida en un buffer reutilizado por hilo.
+
+    El mensaje, la traza de la excepción y el stack se escriben en un
+    StringIO propio del hilo en lugar de concatenar cadenas, y el texto
+    resultante se guarda en el registro: los handlers de consola y
+    archivo (y la comprobación de rotación) comparten un solo formateo.
+    """
+
+    _tls = threading.local()
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Formatea el registro una sola vez por formatter."""
+        cached = getattr(record, "_pooled_msg", None)
+        if cached is not None and cached[0] is self:
+            return cached[1]
+
+        buf = getattr(self._tls, "buf", None)
+        if buf is None:
+            buf = self._tls.buf = io.StringIO()
+        buf.seek(0)
+        buf.truncate()
+
+        record.message = record.getMessage()
+        if self.usesTime():
+            record.asctime = self.formatTime(record, self.datefmt)
+        buf.write(self.formatMessage(record))
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            buf.write("\n")
+            buf.write(record.exc_text)
+        if record.stack_info:
+            buf.write("\n")
+            buf.write(self.formatStack(record.stack_info))
+
+        msg = buf.getvalue()
+        record._pooled_msg = (self, msg)
+        return msg
+
+
+class _FastRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler que evita consultar el sistema de archivos en cada registro.
+
+    El handler estándar hace stat() del archivo y seek/tell del stream en
+    cada emit para decidir la rotación. Aquí se lleva la cuenta de lo
+    escrito y solo se delega en la comprobación completa cuando el
+    registro podría superar maxBytes.
+
+    Además escribe con un buffer de 64 KiB y nunca vuelca dentro de emit:
+    los registros WARNING o superiores solo marcan el buffer como urgente
+    y el listener lo vuelca al vaciarse la cola (ver flush_urgent), de
+    modo que una ráfaga se escribe con una sola llamada al sistema. El
+    resto se vuelca periódicamente (ver _start_periodic_flush) o al cerrar.
+
+    La rotación solo renombra el archivo actual a un nombre temporal y
+    abre uno nuevo; el desplazamiento de los backups (.1 → .2 ...) se
+    hace en un hilo aparte para no detener la escritura.
+    """
+
+    BUFFER_SIZE = 64 * 1024
+    FLUSH_LEVEL = logging.WARNING
+
+    _skip_flush = False
+    _urgent = False
+
+    def __init__(self, *args, **kwargs):
+        # Antes de super(): con delay=False el constructor ya abre el archivo
+        self._pending_rotations = deque()
+        self._rotate_lock = threading.RLock()
+        super().__init__(*args, **kwargs)
+
+    def _open(self):
+        """Abre el archivo con buffer grande e inicializa el contador con su tamaño actual."""
+        stream = open(self.baseFilename, self.mode, buffering=self.BUFFER_SIZE,
+                      encoding=self.encoding, errors=getattr(self, "errors", None))
+        stream.seek(0, 2)
+        self._size = stream.tell()
+        return stream
+
+    def flush(self):
+        """Vuelca el buffer, salvo dentro de emit."""
+        if not self._skip_flush:
+            super().flush()
+
+    def flush_urgent(self):
+        """Vuelca el buffer si se escribió algún registro de nivel FLUSH_LEVEL o superior."""
+        if self._urgent:
+            self._urgent = False
+            self.flush()
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """Decide la rotación con el contador interno mientras quede margen."""
+        if self.stream is None:
+            self.stream = self._open()
+
+        if self.maxBytes <= 0:
+            self._record_size = 0
+            return False
+
+        # Tamaño en bytes tal como queda en disco (codificación y fin de línea del sistema)
+        text = self.format(record) + self.terminator
+        if os.linesep != "\n":
+            text = text.replace("\n", os.linesep)
+        self._record_size = len(text.encode(self.encoding or locale.getpreferredencoding(False),
+                                            errors="replace"))
+        if self._size + self._record_size < self.maxBytes:
+            return False
+
+        # Cerca del límite: comprobación completa del handler estándar
+        return super().shouldRollover(record)
+
+    def emit(self, record: logging.LogRecord):
+        """Escribe el registro y lo suma al tamaño (tras una rotación, al archivo nuevo)."""
+        if record.levelno >= self.FLUSH_LEVEL:
+            self._urgent = True
+        self._skip_flush = True
+        try:
+            super().emit(record)
+        finally:
+            self._skip_flush = False
+        self._size += self._record_size
+
+    def doRollover(self):
+        """Aparta el archivo actual y abre uno nuevo; los backups se desplazan en segundo plano."""
+        if self.backupCount <= 0:
+            super().doRollover()
+            return
+
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+
+        temp_name = f"{self.baseFilename}.rotating.{time.time_ns()}"
+        try:
+            os.rename(self.baseFilename, temp_name)
+        except OSError:
+            # No se pudo apartar: rotación síncrona estándar
+            super().doRollover()
+            return
+
+        self._pending_rotations.append(temp_name)
+        if not self.delay:
+            self.stream = self._open()
+
+        threading.Thread(target=self._shift_backups, name="log-rotate", daemon=True).start()
+
+    def _shift_backups(self):
+        """Desplaza los backups y coloca como .1 cada archivo apartado, en orden."""
+        with self._rotate_lock:
+            while self._pending_rotations:
+                temp_name = self._pending_rotations.popleft()
+                try:
+                    for i in range(self.backupCount - 1, 0, -1):
+                        src = self.rotation_filename(f"{self.baseFilename}.{i}")
+                        dst = self.rotation_filename(f"{self.baseFilename}.{i + 1}")
+                        if os.path.exists(src):
+                            if os.path.exists(dst):
+                                os.remove(dst)
+                            os.rename(src, dst)
+
+                    dst = self.rotation_filename(f"{self.baseFilename}.1")
+                    if os.path.exists(dst):
+                        os.remove(dst)
+                    self.rotate(temp_name, dst)
+                except OSError as e:
+                    sys.stderr.write(f"Error rotando log {temp_name}: {e}\n")
+
+    def close(self):
+        """Cierra el archivo completando antes las rotaciones pendientes."""
+        self._shift_backups()
+        super().close()
+
+
+def _start_periodic_flush(handler: logging.Handler, interval: float):
+    """
+    Vuelca periódicamente un handler con buffer desde un hilo demonio.
+
+    Args:
+        handler: Handler a volcar
+        interval: Segundos entre volcados
+    """
+    stop = threading.Event()
+
+    def run():
+        while not stop.wait(interval):
+            handler.flush()
+
+    threading.Thread(target=run, name="log-flush", daemon=True).start()
+    atexit.register(stop.set)
+
+
+class _BatchingQueueListener(QueueListener):
+    """
+    QueueListener que agrupa los volcados urgentes a archivo por ráfaga.
+
+    Tras cada registro, si la cola ha quedado vacía, vuelca los handlers
+    de archivo con registros urgentes pendientes. Durante una ráfaga de
+    registros (p. ej. DEBUG a la frecuencia de los IMUs) se acumulan en
+    el buffer y se escriben de una vez al terminar.
+    """
+
+    def __init__(self, log_queue: queue.Queue, *handlers, respect_handler_level: bool = False):
+        super().__init__(log_queue, *handlers, respect_handler_level=respect_handler_level)
+        self._buffered = [h for h in handlers if isinstance(h, _FastRotatingFileHandler)]
+
+    def handle(self, record: logging.LogRecord):
+        """Despacha el registro y vuelca los buffers urgentes si no quedan más en cola."""
+        super().handle(record)
+        if self._buffered and self.queue.empty():
+            for handler in self._buffered:
+                handler.flush_urgent()
+
+
+# Nivel y formato resueltos una sola vez (LOGGING_CONFIG no cambia en ejecución)
+_LEVEL = getattr(logging, LOGGING_CONFIG["level"])
+_FORMATTER = _PooledFormatter(
+    LOGGING_CONFIG["format"],
+    datefmt=LOGGING_CONFIG["date_format"]
+)
+
+# Handlers compartidos por todos los loggers y listener que escribe en archivo
+_handlers: Optional[List[logging.Handler]] = None
+_queue_listener: Optional[QueueListener] = None
+_setup_lock = threading.Lock()
+
+
+def _get_handlers() -> List[logging.Handler]:
+    """
+    Obtiene los handlers compartidos, creándolos la primera vez.
+
+    La consola se escribe de forma síncrona en el hilo que registra, para
+    que su salida conserve el orden respecto a print(). El archivo va
+    detrás de una cola: los hilos que registran (adquisición, análisis,
+    UI) solo hacen un put en memoria y un único hilo QueueListener
+    formatea y escribe en disco.
+
+    Returns:
+        Handlers a añadir a cada logger
+    """
+    global _handlers, _queue_listener
+
+    with _setup_lock:
+        if _handlers is not None:
+            return _handlers
+
+        # Handler para consola
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(_FORMATTER)
+        handlers: List[logging.Handler] = [console_handler]
+
+        # Handler para archivo (si está habilitado)
+        if LOGGING_CONFIG["file_enabled"]:
+            file_handler = _FastRotatingFileHandler(
+                LOGGING_CONFIG["file_path"],
+                maxBytes=LOGGING_CONFIG["max_file_size"],
+                backupCount=LOGGING_CONFIG["backup_count"],
+                encoding='utf-8'
+            )
+            file_handler.setLevel(logging.DEBUG)
+            file_handler.setFormatter(_FORMATTER)
+
+            _start_periodic_flush(file_handler, LOGGING_CONFIG["flush_interval"])
+
+            log_queue = queue.Queue(-1)
+            _queue_listener = _BatchingQueueListener(log_queue, file_handler, respect_handler_level=True)
+            _queue_listener.start()
+
+            # Vaciar la cola antes de que logging cierre los handlers al salir
+            atexit.register(_queue_listener.stop)
+
+            handlers.append(QueueHandler(log_queue))
+
+        _handlers = handlers
+        return _handlers
+
+
 class BiomechLogger:
     """
     Logger personalizado para el sistema biomecánico.
@@ -31,64 +320,52 @@ class BiomechLogger:
             name: Nombre del logger
         """
         self.logger = logging.getLogger(name)
-        self.logger.setLevel(getattr(logging, LOGGING_CONFIG["level"]))
+        self.logger.setLevel(_LEVEL)
 
         # Evitar duplicación de handlers
         if self.logger.handlers:
             return
 
-        # Formato de log
-        formatter = logging.Formatter(
-            LOGGING_CONFIG["format"],
-            datefmt=LOGGING_CONFIG["date_format"]
-        )
+        # Consola directa; el archivo solo encola el registro (lo escribe el hilo del listener)
+        for handler in _get_handlers():
+            self.logger.addHandler(handler)
 
-        # Handler para consola
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
-        console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
+    def isEnabledFor(self, level: int) -> bool:
+        """Indica si un mensaje del nivel dado se registraría."""
+        return self.logger.isEnabledFor(level)
 
-        # Handler para archivo (si está habilitado)
-        if LOGGING_CONFIG["file_enabled"]:
-            file_handler = RotatingFileHandler(
-                LOGGING_CONFIG["file_path"],
-                maxBytes=LOGGING_CONFIG["max_file_size"],
-                backupCount=LOGGING_CONFIG["backup_count"],
-                encoding='utf-8'
-            )
-            file_handler.setLevel(logging.DEBUG)
-            file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
-
-    def debug(self, message: str, **kwargs):
+    def debug(self, message: str, *args, **kwargs):
         """Log de debug."""
-        self.logger.debug(message, **kwargs)
+        self.logger.debug(message, *args, **kwargs)
 
-    def info(self, message: str, **kwargs):
+    def info(self, message: str, *args, **kwargs):
         """Log de información."""
-        self.logger.info(message, **kwargs)
+        self.logger.info(message, *args, **kwargs)
 
-    def warning(self, message: str, **kwargs):
+    def warning(self, message: str, *args, **kwargs):
         """Log de advertencia."""
-        self.logger.warning(message, **kwargs)
+        self.logger.warning(message, *args, **kwargs)
 
-    def error(self, message: str, exc_info: bool = False, **kwargs):
+    def error(self, message: str, *args, exc_info: bool = False, **kwargs):
         """Log de error."""
-        self.logger.error(message, exc_info=exc_info, **kwargs)
+        self.logger.error(message, *args, exc_info=exc_info, **kwargs)
 
-    def critical(self, message: str, exc_info: bool = False, **kwargs):
+    def critical(self, message: str, *args, exc_info: bool = False, **kwargs):
         """Log crítico."""
-        self.logger.critical(message, exc_info=exc_info, **kwargs)
+        self.logger.critical(message, *args, exc_info=exc_info, **kwargs)
 
-    def exception(self, message: str, **kwargs):
+    def exception(self, message: str, *args, **kwargs):
         """Log de excepción con traceback."""
-        self.logger.exception(message, **kwargs)
+        self.logger.exception(message, *args, **kwargs)
 
 
 # Logger global del sistema
 system_logger = BiomechLogger("BiomechSystem")
 
+# Loggers por módulo ya creados
+_logger_cache: Dict[str, BiomechLogger] = {"BiomechSystem": system_logger}
+_cache_lock = threading.Lock()
+
 
 def get_logger(name: str) -> BiomechLogger:
     """
@@ -98,9 +375,15 @@ def get_logger(name: str) -> BiomechLogger:
         name: Nombre del módulo
 
     Returns:
-        Instancia de BiomechLogger
+        Instancia de BiomechLogger (compartida entre llamadas con el mismo nombre)
     """
-    return BiomechLogger(name)
+    logger = _logger_cache.get(name)
+    if logger is None:
+        with _cache_lock:
+            logger = _logger_cache.get(name)
+            if logger is None:
+                logger = _logger_cache[name] = BiomechLogger(name)
+    return logger
 
 
 # Funciones de conveniencia
@@ -133,24 +416,27 @@ def log_session_start(patient_id: str, exercise_type: str):
 
 def log_session_end(patient_id: str, duration: float, success: bool):
     """Registra el fin de una sesión de captura."""
-    status = "exitosa" if success else "fallida"
+    if not system_logger.isEnabledFor(logging.INFO):
+        return
     system_logger.info(
-        f"Sesión finalizada ({status}) - Paciente: {patient_id}, "
-        f"Duración: {duration:.2f}s"
+        "Sesión finalizada (%s) - Paciente: %s, Duración: %.2fs",
+        "exitosa" if success else "fallida", patient_id, duration
     )
 
 
 def log_sensor_event(sensor_location: str, event: str, details: str = ""):
     """Registra eventos de sensores."""
-    message = f"Sensor {sensor_location}: {event}"
-    if details:
-        message += f" - {details}"
-    system_logger.info(message)
+    if not system_logger.isEnabledFor(logging.INFO):
+        return
+    system_logger.info("Sensor %s: %s%s", sensor_location, event,
+                       f" - {details}" if details else "")
 
 
 def log_analysis_step(step_name: str, status: str, duration: Optional[float] = None):
     """Registra pasos del análisis."""
-    message = f"Análisis - {step_name}: {status}"
+    if not system_logger.isEnabledFor(logging.INFO):
+        return
     if duration:
-        message += f" (duración: {duration:.2f}s)"
-    system_logger.info(message)
+        system_logger.info("Análisis - %s: %s (duración: %.2fs)", step_name, status, duration)
+    else:
+        system_logger.info("Análisis - %s: %s", step_name, status)
@@ -0,0 +1,66 @@
+"""
+Decimación de series temporales para visualización.
+
+Implementa Largest-Triangle-Three-Buckets (LTTB), que reduce el número
+de puntos de una curva conservando su forma visual (picos y valles).
+"""
+
+from typing import Tuple
+import numpy as np
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce una serie (x, y) a n_out puntos con el algoritmo LTTB.
+
+    El primer y último punto se conservan; el resto se divide en
+    n_out - 2 buckets y de cada uno se elige el punto que forma el
+    triángulo de mayor área con el punto elegido anterior y el
+    promedio del bucket siguiente.
+
+    Args:
+        x: Datos eje X (monótonamente crecientes)
+        y: Datos eje Y
+        n_out: Número de puntos de salida
+
+    Returns:
+        Tuple (x_decimado, y_decimado)
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n = len(x)
+
+    if n_out >= n or n_out < 3:
+        return x, y
+
+    # Límites de los buckets interiores (excluyen el primer y último punto)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    sizes = np.diff(edges)
+
+    # Promedios de cada bucket en una sola pasada
+    avg_x = np.add.reduceat(x[:n - 1], edges[:-1]) / sizes
+    avg_y = np.add.reduceat(y[:n - 1], edges[:-1]) / sizes
+
+    # El "bucket siguiente" del último bucket es el último punto
+    next_x = np.append(avg_x[1:], x[-1])
+    next_y = np.append(avg_y[1:], y[-1])
+
+    indices = np.empty(n_out, dtype=np.intp)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        bx = x[start:end]
+        by = y[start:end]
+
+        # Doble del área del triángulo (a, punto candidato, promedio siguiente)
+        area = np.abs(
+            (x[a] - next_x[i]) * (by - y[a])
+            - (x[a] - bx) * (next_y[i] - y[a])
+        )
+        a = start + int(np.argmax(area))
+        indices[i + 1] = a
+
+    return x[indices], y[indices]
@@ -5,15 +5,67 @@ Proporciona funciones de validación para asegurar
 la integridad de los datos del sistema.
 """
 
-import re
-from typing import Optional, Tuple
+import logging
+import operator
+import os
+import stat
+import string
+from functools import lru_cache, wraps
+from typing import Dict, Optional, Tuple
 import numpy as np
 
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Límites físicos de los datos IMU
+QUATERNION_NORM_RANGE = (0.9, 1.1)
+MAX_ACCELERATION = 200.0  # m/s² (~20g)
+MAX_ANGULAR_VELOCITY = 35.0  # rad/s (~2000 °/s)
 
+# Límites de la plataforma de fuerza (al cuadrado: se compara f² sin abs)
+MAX_FORCE = 10000.0  # N
+MAX_MOMENT = 1000.0  # Nm
+_MAX_FORCE_SQ = MAX_FORCE * MAX_FORCE
+_MAX_MOMENT_SQ = MAX_MOMENT * MAX_MOMENT
+
+# Caracteres permitidos en un ID de paciente
+_PATIENT_ID_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+
+
+def _cached_validator(func):
+    """
+    Cachea un validador puro sin romper su contrato con entradas no hashables.
+
+    Guardar repetidamente los mismos datos no repite las comprobaciones.
+    typed=True evita que 30 y 30.0 compartan entrada (isinstance difiere).
+    Si algún argumento no es hashable (p. ej. una lista), se valida sin
+    caché y se devuelve (False, mensaje) igual. La hashabilidad se
+    comprueba antes de llamar, para no confundirla con un TypeError
+    del propio validador.
+
+    Args:
+        func: Validador a cachear
+
+    Returns:
+        Validador con caché
+    """
+    cached = lru_cache(maxsize=64, typed=True)(func)
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            hash((args, tuple(kwargs.items())))
+        except TypeError:
+            return func(*args, **kwargs)
+        return cached(*args, **kwargs)
+
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+@_cached_validator
 def validate_patient_id(patient_id: str) -> Tuple[bool, Optional[str]]:
     """
     Valida el formato del ID de paciente.
@@ -34,12 +86,13 @@ def validate_patient_id(patient_id: str) -> Tuple[bool, Optional[str]]:
         return False, "El ID no puede exceder 20 caracteres"
 
     # Solo alfanuméricos, guiones y guiones bajos
-    if not re.match(r'^[A-Za-z0-9_-]+$', patient_id):
+    if not _PATIENT_ID_CHARS.issuperset(patient_id):
         return False, "El ID solo puede contener letras, números, guiones y guiones bajos"
 
     return True, None
 
 
+@_cached_validator
 def validate_patient_data(name: str, age: int, mass: float, height: float) -> Tuple[bool, Optional[str]]:
     """
     Valida datos antropométricos del paciente.
@@ -60,21 +113,89 @@ def validate_patient_data(name: str, age: int, mass: float, height: float) -> Tu
     if len(name) < 2:
         return False, "El nombre debe tener al menos 2 caracteres"
 
-    # Validar edad
-    if not isinstance(age, int) or age < 0 or age > 150:
+    # Validar edad (operator.index acepta enteros de Python y numpy, no floats)
+    try:
+        age_ok = 0 <= operator.index(age) <= 150
+    except TypeError:
+        age_ok = False
+    if not age_ok:
         return False, "La edad debe estar entre 0 y 150 años"
 
-    # Validar masa
-    if not isinstance(mass, (int, float)) or mass <= 0 or mass > 500:
+    # Validar masa (sumar 0.0 falla con TypeError si no es numérica; los
+    # arrays de varios elementos fallan con ValueError al comparar)
+    try:
+        mass_ok = 0.0 < mass + 0.0 <= 500.0
+    except (TypeError, ValueError):
+        mass_ok = False
+    if not mass_ok:
         return False, "La masa debe estar entre 0 y 500 kg"
 
     # Validar altura
-    if not isinstance(height, (int, float)) or height <= 0 or height > 3.0:
+    try:
+        height_ok = 0.0 < height + 0.0 <= 3.0
+    except (TypeError, ValueError):
+        height_ok = False
+    if not height_ok:
         return False, "La altura debe estar entre 0 y 3.0 metros"
 
     return True, None
 
 
+def _any_abs_greater(values: np.ndarray, limit: float) -> bool:
+    """
+    Indica si algún |valor| supera el límite.
+
+    Usa las reducciones max/min directamente sobre el array: a diferencia
+    de np.any(np.abs(x) > limit) no crea arrays temporales.
+
+    Args:
+        values: Array de valores
+        limit: Límite (positivo)
+
+    Returns:
+        True si algún valor está fuera de [-limit, limit] (False si está vacío)
+    """
+    if values.size == 0:
+        return False
+    return values.max() > limit or values.min() < -limit
+
+
+def _imu_range_error(quaternions: np.ndarray, accelerations: np.ndarray,
+                     angular_velocities: np.ndarray) -> Optional[Tuple[int, str]]:
+    """
+    Busca la primera muestra IMU fuera de rango en un bloque de muestras.
+
+    Cada comprobación es una única reducción sobre todo el bloque.
+
+    Args:
+        quaternions: Array (N, 4) [w, x, y, z]
+        accelerations: Array (N, 3)
+        angular_velocities: Array (N, 3)
+
+    Returns:
+        (índice de la muestra, mensaje_error) o None si todo es válido
+    """
+    # Normalización del cuaternión (norma ~ 1.0) sin calcular raíces
+    low, high = QUATERNION_NORM_RANGE
+    sq_norms = np.einsum('ij,ij->i', quaternions, quaternions)
+    bad = ~((sq_norms > low * low) & (sq_norms < high * high))
+    if bad.any():
+        i = int(np.argmax(bad))
+        return i, f"Cuaternión no normalizado (norma = {np.sqrt(sq_norms[i]):.3f})"
+
+    # Rangos razonables de aceleración (±200 m/s² = ~20g)
+    if _any_abs_greater(accelerations, MAX_ACCELERATION):
+        bad = np.abs(accelerations).max(axis=1) > MAX_ACCELERATION
+        return int(np.argmax(bad)), "Aceleración fuera de rango razonable (>200 m/s²)"
+
+    # Rangos razonables de velocidad angular (±35 rad/s = ~2000 °/s)
+    if _any_abs_greater(angular_velocities, MAX_ANGULAR_VELOCITY):
+        bad = np.abs(angular_velocities).max(axis=1) > MAX_ANGULAR_VELOCITY
+        return int(np.argmax(bad)), "Velocidad angular fuera de rango razonable (>35 rad/s)"
+
+    return None
+
+
 def validate_imu_data(quaternion: np.ndarray, acceleration: np.ndarray,
                      angular_velocity: np.ndarray) -> Tuple[bool, Optional[str]]:
     """
@@ -88,30 +209,53 @@ def validate_imu_data(quaternion: np.ndarray, acceleration: np.ndarray,
     Returns:
         Tuple (es_valido, mensaje_error)
     """
-    # Validar cuaternión
     if quaternion.shape != (4,):
         return False, "El cuaternión debe tener 4 componentes"
 
-    # Verificar normalización (debe ser ~ 1.0)
-    quat_norm = np.linalg.norm(quaternion)
-    if not (0.9 < quat_norm < 1.1):
-        return False, f"Cuaternión no normalizado (norma = {quat_norm:.3f})"
-
-    # Validar aceleración
     if acceleration.shape != (3,):
         return False, "La aceleración debe tener 3 componentes"
 
-    # Verificar rangos razonables (±200 m/s² = ~20g)
-    if np.any(np.abs(acceleration) > 200):
-        return False, "Aceleración fuera de rango razonable (>200 m/s²)"
-
-    # Validar velocidad angular
     if angular_velocity.shape != (3,):
         return False, "La velocidad angular debe tener 3 componentes"
 
-    # Verificar rangos razonables (±35 rad/s = ~2000 °/s)
-    if np.any(np.abs(angular_velocity) > 35):
-        return False, "Velocidad angular fuera de rango razonable (>35 rad/s)"
+    error = _imu_range_error(quaternion[None], acceleration[None], angular_velocity[None])
+    if error is not None:
+        return False, error[1]
+
+    return True, None
+
+
+def validate_imu_data_batch(quaternions: np.ndarray, accelerations: np.ndarray,
+                            angular_velocities: np.ndarray) -> Tuple[bool, Optional[str]]:
+    """
+    Valida un bloque de muestras IMU de una sola vez.
+
+    Equivale a llamar a validate_imu_data por muestra, pero con tres
+    reducciones sobre todo el bloque en lugar de 3×N.
+
+    Args:
+        quaternions: Array (N, 4) [w, x, y, z]
+        accelerations: Array (N, 3)
+        angular_velocities: Array (N, 3)
+
+    Returns:
+        Tuple (es_valido, mensaje_error)
+    """
+    n = len(quaternions)
+
+    if quaternions.shape != (n, 4):
+        return False, "Los cuaterniones deben tener forma (N, 4)"
+
+    if accelerations.shape != (n, 3):
+        return False, "Las aceleraciones deben tener forma (N, 3)"
+
+    if angular_velocities.shape != (n, 3):
+        return False, "Las velocidades angulares deben tener forma (N, 3)"
+
+    error = _imu_range_error(quaternions, accelerations, angular_velocities)
+    if error is not None:
+        index, message = error
+        return False, f"Muestra {index}: {message}"
 
     return True, None
 
@@ -128,17 +272,20 @@ def validate_force_data(fx: float, fy: float, fz: float,
     Returns:
         Tuple (es_valido, mensaje_error)
     """
-    # Verificar tipos
-    values = [fx, fy, fz, mx, my, mz]
-    if not all(isinstance(v, (int, float)) for v in values):
+    # Comparaciones escalares directas (sin listas ni generadores); un valor
+    # no numérico hace fallar la aritmética con TypeError
+    try:
+        force_out = bool((fx * fx > _MAX_FORCE_SQ) | (fy * fy > _MAX_FORCE_SQ) | (fz * fz > _MAX_FORCE_SQ))
+        moment_out = bool((mx * mx > _MAX_MOMENT_SQ) | (my * my > _MAX_MOMENT_SQ) | (mz * mz > _MAX_MOMENT_SQ))
+    except (TypeError, ValueError):
         return False, "Todos los valores deben ser numéricos"
 
     # Verificar rangos de fuerza (±10000 N = ±1000 kg)
-    if any(abs(f) > 10000 for f in [fx, fy, fz]):
+    if force_out:
         return False, "Fuerza fuera de rango razonable (>10000 N)"
 
     # Verificar rangos de momento (±1000 Nm)
-    if any(abs(m) > 1000 for m in [mx, my, mz]):
+    if moment_out:
         return False, "Momento fuera de rango razonable (>1000 Nm)"
 
     return True, None
@@ -164,8 +311,8 @@ def validate_time_series(time: np.ndarray, data: np.ndarray,
     if len(time) < 2:
         return False, "Se requieren al menos 2 puntos de datos"
 
-    # Verificar monotonía del tiempo
-    if not np.all(np.diff(time) > 0):
+    # Verificar monotonía del tiempo (comparación de vistas: sin array de diferencias)
+    if not np.all(time[1:] > time[:-1]):
         return False, "El vector de tiempo debe ser estrictamente creciente"
 
     # Verificar frecuencia si se especifica
@@ -177,7 +324,7 @@ def validate_time_series(time: np.ndarray, data: np.ndarray,
             return False, f"Frecuencia incorrecta: esperada {expected_rate} Hz, actual {actual_rate:.1f} Hz"
 
     # Verificar que no haya NaN o Inf
-    if np.any(np.isnan(data)) or np.any(np.isinf(data)):
+    if not np.isfinite(data).all():
         return False, "Los datos contienen valores NaN o Infinito"
 
     return True, None
@@ -210,23 +357,22 @@ def validate_metrics(metrics: dict) -> Tuple[bool, Optional[str]]:
     Returns:
         Tuple (es_valido, mensaje_error)
     """
+    # Las comparaciones encadenadas son falsas para NaN, así que también lo rechazan
+
     # Verificar ROM
-    if 'rom_flexion' in metrics:
-        rom = metrics['rom_flexion']
-        if not (0 < rom < 180):
-            return False, f"ROM de flexión fuera de rango fisiológico: {rom:.1f}°"
+    rom = metrics.get('rom_flexion')
+    if rom is not None and not (0 < rom < 180):
+        return False, f"ROM de flexión fuera de rango fisiológico: {rom:.1f}°"
 
     # Verificar momentos (normalizados por masa)
-    if 'peak_flexion_moment' in metrics:
-        moment = abs(metrics['peak_flexion_moment'])
-        if moment > 10.0:  # 10 Nm/kg es extremadamente alto
-            return False, f"Momento de flexión excesivo: {moment:.2f} Nm/kg"
+    moment = metrics.get('peak_flexion_moment')
+    if moment is not None and not (-10.0 <= moment <= 10.0):  # 10 Nm/kg es extremadamente alto
+        return False, f"Momento de flexión excesivo: {abs(moment):.2f} Nm/kg"
 
     # Verificar GRF (normalizada)
-    if 'peak_vertical_grf_normalized' in metrics:
-        grf = metrics['peak_vertical_grf_normalized']
-        if not (0.1 < grf < 10.0):  # Entre 0.1 y 10 veces peso corporal
-            return False, f"GRF fuera de rango razonable: {grf:.2f} × PC"
+    grf = metrics.get('peak_vertical_grf_normalized')
+    if grf is not None and not (0.1 < grf < 10.0):  # Entre 0.1 y 10 veces peso corporal
+        return False, f"GRF fuera de rango razonable: {grf:.2f} × PC"
 
     return True, None
 
@@ -239,34 +385,52 @@ def validate_file_path(filepath: str, must_exist: bool = True,
     Args:
         filepath: Ruta al archivo
         must_exist: Si True, el archivo debe existir
-        allowed_extensions: Lista de extensiones permitidas (ej: ['.xlsx', '.csv'])
+        allowed_extensions: Extensiones permitidas, en minúsculas (ej: ['.xlsx', '.csv'])
 
     Returns:
         Tuple (es_valido, mensaje_error)
     """
-    from pathlib import Path
-
     if not filepath:
         return False, "La ruta de archivo no puede estar vacía"
 
-    path = Path(filepath)
+    # Un único stat() para existencia y tipo
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        st = None
 
     # Verificar existencia
-    if must_exist and not path.exists():
+    if must_exist and st is None:
         return False, f"El archivo no existe: {filepath}"
 
     # Verificar extensión
     if allowed_extensions is not None:
-        if path.suffix.lower() not in allowed_extensions:
+        if os.path.splitext(filepath)[1].lower() not in allowed_extensions:
             return False, f"Extensión no permitida. Use: {', '.join(allowed_extensions)}"
 
     # Verificar que no sea directorio
-    if path.exists() and path.is_dir():
+    if st is not None and stat.S_ISDIR(st.st_mode):
         return False, "La ruta es un directorio, no un archivo"
 
     return True, None
 
 
+@lru_cache(maxsize=None)
+def _exercise_table() -> Dict[str, Tuple[float, float, int, int]]:
+    """
+    Tabla (min_dur, max_dur, min_rep, max_rep) por tipo de ejercicio.
+
+    Se construye en la primera llamada; la importación es diferida para
+    no acoplar la carga de este módulo a config.settings.
+    """
+    from config.settings import EXERCISES
+
+    return {
+        key: (*config['duration_range'], *config['repetitions_range'])
+        for key, config in EXERCISES.items()
+    }
+
+
 def validate_exercise_config(exercise_type: str, duration: float,
                             repetitions: int) -> Tuple[bool, Optional[str]]:
     """
@@ -280,21 +444,19 @@ def validate_exercise_config(exercise_type: str, duration: float,
     Returns:
         Tuple (es_valido, mensaje_error)
     """
-    from config.settings import EXERCISES
+    row = _exercise_table().get(exercise_type)
 
     # Verificar tipo de ejercicio
-    if exercise_type not in EXERCISES:
+    if row is None:
         return False, f"Tipo de ejercicio inválido: {exercise_type}"
 
-    config = EXERCISES[exercise_type]
+    min_dur, max_dur, min_rep, max_rep = row
 
     # Verificar duración
-    min_dur, max_dur = config['duration_range']
     if not (min_dur <= duration <= max_dur):
         return False, f"Duración debe estar entre {min_dur} y {max_dur} segundos"
 
     # Verificar repeticiones
-    min_rep, max_rep = config['repetitions_range']
     if not (min_rep <= repetitions <= max_rep):
         return False, f"Repeticiones deben estar entre {min_rep} y {max_rep}"
 
@@ -312,12 +474,17 @@ def check_signal_quality(data: np.ndarray, threshold: float = 0.6) -> Tuple[floa
     Returns:
         Tuple (calidad, es_aceptable)
     """
-    # Calcular métricas de calidad
-    nan_ratio = np.sum(np.isnan(data)) / len(data)
-    zero_ratio = np.sum(data == 0) / len(data)
+    n = len(data)
+
+    # Calcular métricas de calidad (count_nonzero cuenta sin convertir a enteros)
+    nan_mask = np.isnan(data)
+    nan_count = np.count_nonzero(nan_mask)
+    nan_ratio = nan_count / n
+    zero_ratio = np.count_nonzero(data == 0) / n
 
-    # Calcular varianza (señal con poca variación = baja calidad)
-    variance = np.nanvar(data)
+    # Calcular varianza (señal con poca variación = baja calidad); sin NaN
+    # se evita la ruta de nanvar, que copia y recorre los datos varias veces
+    variance = np.var(data[~nan_mask]) if nan_count else np.var(data)
     variance_score = min(variance / 100, 1.0)  # Normalizar
 
     # Score de calidad combinado
@@ -367,9 +534,9 @@ def validate_all(patient_id: str, patient_data: dict, imu_data: dict,
 
     if is_valid:
         logger.info("✓ Validación completa exitosa")
-    else:
-        logger.warning(f"⚠ Validación falló con {len(errors)} errores")
-        for error in errors:
-            logger.warning(f"  - {error}")
+    elif logger.isEnabledFor(logging.WARNING):
+        # Un único registro con todos los errores
+        logger.warning("⚠ Validación falló con %d errores:\n  - %s",
+                       len(errors), "\n  - ".join(errors))
 
     return is_valid, errors
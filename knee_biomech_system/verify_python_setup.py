@@ -6,6 +6,17 @@ sean compatibles con OpenSim 4.5.
 """
 
 import sys
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+
+
+def import_package(package_name):
+    """Importa un paquete y devuelve el módulo, o None si no está instalado."""
+    try:
+        return importlib.import_module(package_name)
+    except ImportError:
+        return None
+
 
 print("=" * 70)
 print(" VERIFICACIÓN DE ENTORNO PYTHON")
@@ -46,9 +57,11 @@ else:
 print()
 
 # ============================================================================
-# VERIFICAR PAQUETES CORE
+# IMPORTAR PAQUETES EN PARALELO
 # ============================================================================
-print("📦 2. Verificando paquetes científicos core...")
+# Las importaciones pesadas (scipy, pandas, matplotlib, opensim...) se
+# lanzan todas a la vez; cada sección solo espera el resultado de las suyas
+# y los mensajes se imprimen en el orden habitual.
 
 core_packages = [
     ('numpy', 'NumPy'),
@@ -57,14 +70,42 @@ core_packages = [
     ('sklearn', 'Scikit-learn')
 ]
 
+ui_packages = [
+    ('customtkinter', 'CustomTkinter'),
+    ('PIL', 'Pillow'),
+    ('matplotlib', 'Matplotlib')
+]
+
+data_packages = [
+    ('openpyxl', 'OpenPyXL (Excel)'),
+    ('xlsxwriter', 'XlsxWriter'),
+]
+
+all_packages = core_packages + ui_packages + data_packages + [
+    ('opensim', 'OpenSim'),
+    ('bleak', 'Bleak')
+]
+
+executor = ThreadPoolExecutor(max_workers=8)
+imports = {
+    package_name: executor.submit(import_package, package_name)
+    for package_name, _ in all_packages
+}
+executor.shutdown(wait=False)
+
+# ============================================================================
+# VERIFICAR PAQUETES CORE
+# ============================================================================
+print("📦 2. Verificando paquetes científicos core...")
+
 all_core_installed = True
 
 for package_name, display_name in core_packages:
-    try:
-        mod = __import__(package_name)
+    mod = imports[package_name].result()
+    if mod is not None:
         version = getattr(mod, '__version__', 'unknown')
         print(f"   ✅ {display_name}: {version}")
-    except ImportError:
+    else:
         print(f"   ❌ {display_name}: NO instalado")
         all_core_installed = False
 
@@ -75,20 +116,14 @@ print()
 # ============================================================================
 print("🎨 3. Verificando paquetes de interfaz...")
 
-ui_packages = [
-    ('customtkinter', 'CustomTkinter'),
-    ('PIL', 'Pillow'),
-    ('matplotlib', 'Matplotlib')
-]
-
 all_ui_installed = True
 
 for package_name, display_name in ui_packages:
-    try:
-        mod = __import__(package_name)
+    mod = imports[package_name].result()
+    if mod is not None:
         version = getattr(mod, '__version__', 'unknown')
         print(f"   ✅ {display_name}: {version}")
-    except ImportError:
+    else:
         print(f"   ❌ {display_name}: NO instalado")
         all_ui_installed = False
 
@@ -99,17 +134,12 @@ print()
 # ============================================================================
 print("📊 4. Verificando paquetes de manejo de datos...")
 
-data_packages = [
-    ('openpyxl', 'OpenPyXL (Excel)'),
-    ('xlsxwriter', 'XlsxWriter'),
-]
-
 for package_name, display_name in data_packages:
-    try:
-        mod = __import__(package_name)
+    mod = imports[package_name].result()
+    if mod is not None:
         version = getattr(mod, '__version__', 'unknown')
         print(f"   ✅ {display_name}: {version}")
-    except ImportError:
+    else:
         print(f"   ⚠️ {display_name}: NO instalado (opcional)")
 
 print()
@@ -120,13 +150,13 @@ print()
 print("🦴 5. Verificando OpenSim 4.5...")
 
 opensim_installed = False
-try:
-    import opensim
+opensim = imports['opensim'].result()
+if opensim is not None:
     version = getattr(opensim, '__version__', 'unknown')
     print(f"   ✅ OpenSim instalado: versión {version}")
     print(f"   ✅ ¡Excelente! Análisis IK/ID disponibles")
     opensim_installed = True
-except ImportError:
+else:
     print("   ❌ OpenSim NO instalado")
     print()
     print("   IMPORTANTE: OpenSim es necesario para análisis completo")
@@ -160,12 +190,12 @@ print()
 # ============================================================================
 print("📡 6. Verificando soporte Bluetooth (opcional)...")
 
-try:
-    import bleak
+bleak = imports['bleak'].result()
+if bleak is not None:
     version = getattr(bleak, '__version__', 'unknown')
     print(f"   ✅ Bleak: {version}")
     print(f"   ✅ Conexión con sensores IMU Xsens DOT disponible")
-except ImportError:
+else:
     print("   ⚠️ Bleak NO instalado")
     print("      Sin Bleak: No puedes conectar sensores IMU en tiempo real")
     print("      Para instalar: pip install bleak")